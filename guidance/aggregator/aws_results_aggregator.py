@@ -7,10 +7,232 @@ Aggregates text files from AWS IDP pipeline results and generates a case summary
 
 import os
 import re
+import argparse
 import json
+import mmap
+import locale
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional C-accelerated JSON encoder
+    orjson = None
+
+try:
+    from result_cache import cached
+except ImportError:  # imported as part of the guidance.aggregator package
+    from .result_cache import cached
+
+# Worker threads used to overlap blocking file reads
+READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Files at least this large are decoded straight from a memory map
+MMAP_THRESHOLD = 1024 * 1024
+
+# Precompiled extraction patterns
+PATIENT_NAME_RE = re.compile(r'Patient(?:\s+Name)?[:\s]+([A-Z][a-z]+\s+[A-Z][a-z]+)')
+DOB_RE = re.compile(r'DOB[:\s]+(\d{2}/\d{2}/\d{4})')
+ADDRESS_RE = re.compile(r'Address[:\s]+([^\n]+)')
+ACCIDENT_DATE_RE = re.compile(r'Date of Accident[:\s]+(\d{2}/\d{2}/\d{4})')
+TIME_RE = re.compile(r'Time[:\s]+(\d{2}:\d{2})')
+LOCATION_RE = re.compile(r'Location[:\s]+([^\n]+)')
+REPORT_NUMBER_RE = re.compile(r'Report Number[:\s]+([^\s]+)')
+NARRATIVE_HEADER_RE = re.compile(r'NARRATIVE[:\s]*\n')
+NARRATIVE_END_RE = re.compile(r'VIOLATIONS|WITNESS|$')
+DEFENDANT_DRIVER_RE = re.compile(r'(?:VEHICLE 2|AT-FAULT)[^\n]*\n[^\n]*Driver[:\s]+([A-Z][a-z]+\s+[A-Z][a-z]+)')
+VEHICLE_RE = re.compile(r'Vehicle[:\s]+(20\d{2}\s+[^\n]+?)(?:\s+Plate|$)')
+PROGRESSIVE_RE = re.compile(r'Progressive[^\n]+')
+VTL_RE = re.compile(r'VTL\s+[\d\w\-\(\)]+\s*-\s*[^\n]+')
+DIAGNOSIS_RE = re.compile(r'\d+\.\s+([A-Za-z\s,/]+)(?:\s+ICD)')
+WORK_RESTRICTION_RE = re.compile(r'(?:no work|off work|work restriction)[^\n]*(\d+\s+weeks?)', re.IGNORECASE)
+PLAN_HEADER_RE = re.compile(r'PLAN[:\s]*\n')
+PLAN_END_RE = re.compile(r'Patient is|Attending|$')
+NUMBERED_ITEM_RE = re.compile(r'\d+\.\s+([^\n]+)')
+TOTAL_CHARGES_RE = re.compile(r'Total Charges[:\s]+\$?([\d,]+\.?\d*)')
+INSURANCE_PAYMENT_RE = re.compile(r'Insurance Payment[^\$]*\$?([\d,]+\.?\d*)')
+AMOUNT_DUE_RE = re.compile(r'Amount Due[:\s]+\$?([\d,]+\.?\d*)')
+LIEN_RE = re.compile(r'lien[^\$]*\$?([\d,]+\.?\d*)', re.IGNORECASE)
+CPT_RE = re.compile(r'(\d{5})\s+[A-Z]')
+POLICY_NUMBER_RE = re.compile(r'Policy Number[:\s]+([^\s]+)')
+BI_LIMITS_RE = re.compile(r'Bodily Injury Liability\s+\$?([\d,]+)[^\$]*\$?([\d,]+)')
+PIP_RE = re.compile(r'Personal Injury Protection[^\$]*\$?([\d,]+)')
+SUM_RE = re.compile(r'Underinsured Motorist[^\$]*\$?([\d,]+)[^\$]*\$?([\d,]+)')
+AT_FAULT_RE = re.compile(r'([A-Z][a-z]+\s+[A-Z][a-z]+)[^\n]*(?:is determined to be|determined)\s+AT FAULT')
+WITNESS_RE = re.compile(r'\d+\.\s+[A-Z][a-z]+\s+[A-Z][a-z]+,\s+(?:pedestrian|driver)')
+ROM_LIMITED_RE = re.compile(r'(?:flexion|extension)\s+limited\s+to\s+(\d+)\s+degrees', re.IGNORECASE)
+
+# Single-pass scan over a medical record: ICD-10 codes and body-part mentions.
+# Diagnosis and plan captures span these tokens, so they stay separate patterns.
+MEDICAL_SCAN_RE = re.compile(
+    r'ICD-10[:\s]+(?P<icd>[A-Z]\d+\.\d+[A-Z]*)'
+    r'|(?P<cervical>[Cc]ervical)'
+    r'|(?P<lumbar>[Ll]umbar)'
+    r'|(?P<shoulder>[Ss]houlder)'
+)
+# Single-pass keyword scan over a police report for liability factors and evidence
+LIABILITY_KEYWORDS_RE = re.compile(
+    r'(?P<red_light>red light|red traffic signal)'
+    r'|(?P<cell_phone>cell phone|mobile telephone)'
+    r'|(?P<camera>traffic camera)'
+    r'|(?P<witness>witness)',
+    re.IGNORECASE
+)
+# (text marker, carrier name) pairs, checked in order
+CARRIERS = (
+    ("STATE FARM", "State Farm"),
+    ("Progressive", "Progressive"),
+)
+BODY_PARTS = {
+    "cervical": "Cervical Spine (Neck)",
+    "lumbar": "Lumbar Spine (Lower Back)",
+    "shoulder": "Shoulder",
+}
+
+
+# Markdown report layout, filled from a flat dict of prepared fields
+MARKDOWN_REPORT_TEMPLATE = """# NY Personal Injury Case Summary
+## Case ID: {case_id}
+Generated: {generated_date}
+
+---
+
+## Plaintiff Information
+- **Name:** {plaintiff_name}
+- **Date of Birth:** {plaintiff_dob}
+- **Address:** {plaintiff_address}
+
+## Defendant (At-Fault Party)
+- **Name:** {defendant_name}
+- **Vehicle:** {defendant_vehicle}
+- **Insurance:** {defendant_insurance}
+- **Violations Issued:**
+{violations}
+## Accident Details
+- **Date:** {accident_date}
+- **Time:** {accident_time}
+- **Location:** {accident_location}
+- **Report Number:** {report_number}
+
+**Description:**
+{accident_description}
+
+## Injuries & Diagnoses
+**Body Parts Affected:**
+{body_parts}
+**Diagnoses:**
+{diagnoses}
+**ICD-10 Codes:**
+{icd_codes}
+**Work Restrictions:** {work_restrictions}
+
+## Medical Bills & Special Damages
+| Category | Amount |
+|----------|--------|
+| Total Billed | ${total_charges:,.2f} |
+| Paid by Insurance | ${total_paid:,.2f} |
+| Outstanding Balance | ${total_owed:,.2f} |
+{liens}
+## Insurance Coverage
+### Plaintiff's Policy ({plaintiff_carrier})
+- Policy #: {plaintiff_policy_number}
+- BI Limits: {plaintiff_bi_limits}
+- PIP: {plaintiff_pip_limits}
+- SUM: {plaintiff_sum_limits}
+
+**Available Coverage:**
+- PIP Available: ${pip_available:,.2f}
+- SUM Available: ${sum_available:,.2f}
+
+## Liability Analysis
+**Fault Determination:** {fault_determination}
+
+**Contributing Factors:**
+{contributing_factors}
+**Evidence:**
+{evidence}
+## NY Serious Injury Analysis (Insurance Law 5102(d))
+**Meets Threshold:** {meets_threshold}
+
+**Threshold Categories Met:**
+{threshold_categories}
+**Supporting Evidence:**
+{supporting_evidence}
+**Notes:** {ny_notes}
+
+## Recommended Actions
+{recommended_actions}
+---
+*This summary was automatically generated from IDP-extracted documents.*
+"""
+
+# Removes thousands separators from captured dollar amounts
+AMOUNT_SEPARATORS = str.maketrans('', '', ',')
+
+
+def _parse_amount(amount: str) -> float:
+    """Parse a captured dollar amount such as '1,250.00'"""
+    return float(amount.translate(AMOUNT_SEPARATORS))
+
+
+def _sum_amounts(amounts: List[str]) -> float:
+    """Parse and total a batch of captured dollar amounts"""
+    return sum(map(_parse_amount, amounts), 0.0)
+
+
+def _bullets(items: List[str], prefix: str = "- ") -> str:
+    """Render items as markdown bullet lines"""
+    return "".join(f"{prefix}{item}\n" for item in items)
+
+
+def _find_section(text: str, header_re: re.Pattern, end_re: re.Pattern) -> Optional[str]:
+    """Return the text between a section header and the next section marker
+
+    Equivalent to a lazy DOTALL capture like HEADER(.+?)(?=END|$), but
+    locates the header and the terminator with two forward searches.
+    """
+    header = header_re.search(text)
+    if not header:
+        return None
+    start = header.end()
+    if start == len(text):
+        # The section needs at least one character, so end the header at an
+        # earlier newline in its trailing whitespace when there is one
+        start = text.rfind('\n', header.start(), start - 1) + 1
+        if not start:
+            return None
+    end = end_re.search(text, start + 1)
+    return text[start:end.start()]
+
+
+def _write_json(path: str, data: Any) -> None:
+    """Write data as indented JSON"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+
+def _read_text(path: str) -> str:
+    """Read one extracted text file, memory-mapping large files"""
+    encoding = locale.getpreferredencoding(False)
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            content = f.read().decode(encoding)
+        else:
+            # Decode from the mapped pages without an intermediate bytes copy
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                content = str(mm, encoding)
+
+    # Match read_text()'s universal newline handling
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
 
 class AWSResultsAggregator:
     """Aggregates AWS IDP results from text files"""
@@ -18,58 +240,85 @@ class AWSResultsAggregator:
     def __init__(self, results_folder: str):
         self.results_folder = Path(results_folder)
         self.medical_records_text: List[str] = []
+        self.medical_records_text_lower: List[str] = []
         self.police_reports_text: List[str] = []
         self.insurance_policies_text: List[str] = []
         self.medical_bills_text: List[str] = []
+        self._cache: Dict[str, Any] = {}
+
+        # Document type folder name -> text bucket
+        self._buckets: Dict[str, List[str]] = {
+            "MEDICAL_RECORDS": self.medical_records_text,
+            "POLICE_REPORT": self.police_reports_text,
+            "INSURANCE_POLICY": self.insurance_policies_text,
+            "MEDICAL_BILLS": self.medical_bills_text,
+        }
 
     def load_documents(self) -> None:
         """Load all extracted text documents from AWS results"""
-        for hash_dir in self.results_folder.iterdir():
-            if not hash_dir.is_dir():
-                continue
+        self._cache.clear()
+        pending = []
 
-            # Check for each document type
-            for doc_type_dir in hash_dir.iterdir():
-                if not doc_type_dir.is_dir():
+        with os.scandir(self.results_folder) as hash_dirs:
+            for hash_dir in hash_dirs:
+                if not hash_dir.is_dir():
                     continue
 
-                doc_type = doc_type_dir.name
-                for txt_file in doc_type_dir.glob("*.txt"):
-                    content = txt_file.read_text()
-
-                    if doc_type == "MEDICAL_RECORDS":
-                        self.medical_records_text.append(content)
-                    elif doc_type == "POLICE_REPORT":
-                        self.police_reports_text.append(content)
-                    elif doc_type == "INSURANCE_POLICY":
-                        self.insurance_policies_text.append(content)
-                    elif doc_type == "MEDICAL_BILLS":
-                        self.medical_bills_text.append(content)
-
+                # Check for each document type
+                with os.scandir(hash_dir.path) as doc_type_dirs:
+                    for doc_type_dir in doc_type_dirs:
+                        bucket = self._buckets.get(doc_type_dir.name)
+                        if bucket is None or not doc_type_dir.is_dir():
+                            continue
+
+                        with os.scandir(doc_type_dir.path) as files:
+                            for entry in files:
+                                if entry.name.endswith(".txt") and entry.is_file():
+                                    pending.append((bucket, entry.path))
+
+        if not pending:
+            return
+
+        # Reads are I/O bound, so threads overlap their latency
+        with ThreadPoolExecutor(max_workers=min(READ_WORKERS, len(pending))) as executor:
+            contents = executor.map(_read_text, [path for _, path in pending])
+            for (bucket, _), content in zip(pending, contents):
+                bucket.append(content)
+                # Keyword checks on medical records are case-insensitive
+                if bucket is self.medical_records_text:
+                    self.medical_records_text_lower.append(content.lower())
+
+    @cached
     def extract_patient_info(self) -> Dict[str, Any]:
         """Extract patient/plaintiff info from medical records"""
         info = {"name": "", "dob": "", "address": ""}
 
         for text in self.medical_records_text:
             # Extract patient name
-            name_match = re.search(r'Patient(?:\s+Name)?[:\s]+([A-Z][a-z]+\s+[A-Z][a-z]+)', text)
-            if name_match:
-                info["name"] = name_match.group(1)
+            if not info["name"]:
+                name_match = PATIENT_NAME_RE.search(text)
+                if name_match:
+                    info["name"] = name_match.group(1)
 
             # Extract DOB
-            dob_match = re.search(r'DOB[:\s]+(\d{2}/\d{2}/\d{4})', text)
-            if dob_match:
-                info["dob"] = dob_match.group(1)
+            if not info["dob"]:
+                dob_match = DOB_RE.search(text)
+                if dob_match:
+                    info["dob"] = dob_match.group(1)
+
+            if info["name"] and info["dob"]:
+                break
 
-            # Extract address from police report if available
-            for police_text in self.police_reports_text:
-                addr_match = re.search(r'Address[:\s]+([^\n]+)', police_text)
-                if addr_match and "456 East" in addr_match.group(1):
-                    info["address"] = addr_match.group(1).strip()
-                    break
+        # Extract address from police report if available
+        for police_text in self.police_reports_text:
+            addr_match = ADDRESS_RE.search(police_text)
+            if addr_match and "456 East" in addr_match.group(1):
+                info["address"] = addr_match.group(1).strip()
+                break
 
         return info
 
+    @cached
     def extract_accident_info(self) -> Dict[str, Any]:
         """Extract accident details from police report"""
         info = {
@@ -80,62 +329,80 @@ class AWSResultsAggregator:
             "description": ""
         }
 
+        # The first police report that provides a field wins
         for text in self.police_reports_text:
             # Date
-            date_match = re.search(r'Date of Accident[:\s]+(\d{2}/\d{2}/\d{4})', text)
-            if date_match:
-                info["date"] = date_match.group(1)
+            if not info["date"]:
+                date_match = ACCIDENT_DATE_RE.search(text)
+                if date_match:
+                    info["date"] = date_match.group(1)
 
             # Time
-            time_match = re.search(r'Time[:\s]+(\d{2}:\d{2})', text)
-            if time_match:
-                info["time"] = time_match.group(1)
+            if not info["time"]:
+                time_match = TIME_RE.search(text)
+                if time_match:
+                    info["time"] = time_match.group(1)
 
             # Location
-            loc_match = re.search(r'Location[:\s]+([^\n]+)', text)
-            if loc_match:
-                info["location"] = loc_match.group(1).strip()
+            if not info["location"]:
+                loc_match = LOCATION_RE.search(text)
+                if loc_match:
+                    info["location"] = loc_match.group(1).strip()
 
             # Report number
-            report_match = re.search(r'Report Number[:\s]+([^\s]+)', text)
-            if report_match:
-                info["report_number"] = report_match.group(1)
+            if not info["report_number"]:
+                report_match = REPORT_NUMBER_RE.search(text)
+                if report_match:
+                    info["report_number"] = report_match.group(1)
 
             # Narrative
-            narrative_match = re.search(r'NARRATIVE[:\s]*\n(.+?)(?=VIOLATIONS|WITNESS|$)', text, re.DOTALL)
-            if narrative_match:
-                info["description"] = narrative_match.group(1).strip()[:500]
+            if not info["description"]:
+                narrative = _find_section(text, NARRATIVE_HEADER_RE, NARRATIVE_END_RE)
+                if narrative:
+                    info["description"] = narrative.strip()[:500]
+
+            if all(info.values()):
+                break
 
         return info
 
+    @cached
     def extract_defendant_info(self) -> Dict[str, Any]:
         """Extract defendant/at-fault party info"""
         info = {"name": "", "vehicle": "", "insurance": "", "violations": []}
 
+        # The first police report that provides a field wins
         for text in self.police_reports_text:
             # Look for Vehicle 2 / At-Fault section
             if "AT-FAULT" in text or "Vehicle 2" in text:
                 # Driver name
-                driver_match = re.search(r'(?:VEHICLE 2|AT-FAULT)[^\n]*\n[^\n]*Driver[:\s]+([A-Z][a-z]+\s+[A-Z][a-z]+)', text)
-                if driver_match:
-                    info["name"] = driver_match.group(1)
+                if not info["name"]:
+                    driver_match = DEFENDANT_DRIVER_RE.search(text)
+                    if driver_match:
+                        info["name"] = driver_match.group(1)
 
                 # Vehicle
-                vehicle_match = re.search(r'Vehicle[:\s]+(20\d{2}\s+[^\n]+?)(?:\s+Plate|$)', text)
-                if vehicle_match:
-                    info["vehicle"] = vehicle_match.group(1).strip()
+                if not info["vehicle"]:
+                    vehicle_match = VEHICLE_RE.search(text)
+                    if vehicle_match:
+                        info["vehicle"] = vehicle_match.group(1).strip()
 
                 # Insurance
-                ins_match = re.search(r'Progressive[^\n]+', text)
-                if ins_match:
-                    info["insurance"] = ins_match.group(0).strip()
+                if not info["insurance"]:
+                    ins_match = PROGRESSIVE_RE.search(text)
+                    if ins_match:
+                        info["insurance"] = ins_match.group(0).strip()
 
             # Violations
-            vtl_matches = re.findall(r'VTL\s+[\d\w\-\(\)]+\s*-\s*[^\n]+', text)
-            info["violations"] = vtl_matches
+            if not info["violations"]:
+                info["violations"] = [m.group(0) for m in VTL_RE.finditer(text)]
+
+            if all(info.values()):
+                break
 
         return info
 
+    @cached
     def extract_injuries(self) -> Dict[str, Any]:
         """Extract injury information from medical records"""
         injuries = {
@@ -146,40 +413,42 @@ class AWSResultsAggregator:
             "work_restrictions": ""
         }
 
+        # Deduplicate while collecting; body parts keep first-seen order
+        icd_codes = set()
+        body_parts = {}
+
         for text in self.medical_records_text:
-            # ICD codes
-            icd_matches = re.findall(r'ICD-10[:\s]+([A-Z]\d+\.\d+[A-Z]*)', text)
-            injuries["icd_codes"].extend(icd_matches)
+            # ICD codes and body parts from physical exam in one pass
+            found_parts = set()
+            for match in MEDICAL_SCAN_RE.finditer(text):
+                kind = match.lastgroup
+                if kind == "icd":
+                    icd_codes.add(match.group("icd"))
+                else:
+                    found_parts.add(kind)
+            for key, label in BODY_PARTS.items():
+                if key in found_parts:
+                    body_parts[label] = None
 
             # Diagnoses
-            diag_matches = re.findall(r'\d+\.\s+([A-Za-z\s,/]+)(?:\s+ICD)', text)
-            injuries["diagnoses"].extend([d.strip() for d in diag_matches])
-
-            # Body parts from physical exam
-            if "Cervical" in text or "cervical" in text:
-                injuries["body_parts"].append("Cervical Spine (Neck)")
-            if "Lumbar" in text or "lumbar" in text:
-                injuries["body_parts"].append("Lumbar Spine (Lower Back)")
-            if "Shoulder" in text or "shoulder" in text:
-                injuries["body_parts"].append("Shoulder")
+            injuries["diagnoses"].extend(m.group(1).strip() for m in DIAGNOSIS_RE.finditer(text))
 
             # Work restrictions
-            work_match = re.search(r'(?:no work|off work|work restriction)[^\n]*(\d+\s+weeks?)', text, re.IGNORECASE)
+            work_match = WORK_RESTRICTION_RE.search(text)
             if work_match:
                 injuries["work_restrictions"] = f"No work x {work_match.group(1)}"
 
             # Treatment plan items
-            plan_match = re.search(r'PLAN[:\s]*\n(.+?)(?=Patient is|Attending|$)', text, re.DOTALL)
-            if plan_match:
-                plan_items = re.findall(r'\d+\.\s+([^\n]+)', plan_match.group(1))
-                injuries["treatment_plan"].extend(plan_items)
+            plan = _find_section(text, PLAN_HEADER_RE, PLAN_END_RE)
+            if plan:
+                injuries["treatment_plan"].extend(m.group(1) for m in NUMBERED_ITEM_RE.finditer(plan))
 
-        # Deduplicate
-        injuries["icd_codes"] = list(set(injuries["icd_codes"]))
-        injuries["body_parts"] = list(set(injuries["body_parts"]))
+        injuries["icd_codes"] = list(icd_codes)
+        injuries["body_parts"] = list(body_parts)
 
         return injuries
 
+    @cached
     def extract_medical_bills(self) -> Dict[str, Any]:
         """Extract billing information"""
         bills = {
@@ -191,41 +460,49 @@ class AWSResultsAggregator:
             "cpt_codes": []
         }
 
+        charges, paid, owed = [], [], []
+        cpt_codes = set()
+
         for text in self.medical_bills_text:
             # Provider
             if "BELLEVUE" in text:
                 bills["providers"].append("Bellevue Hospital Center")
 
             # Total charges
-            charges_match = re.search(r'Total Charges[:\s]+\$?([\d,]+\.?\d*)', text)
+            charges_match = TOTAL_CHARGES_RE.search(text)
             if charges_match:
-                bills["total_charges"] += float(charges_match.group(1).replace(',', ''))
+                charges.append(charges_match.group(1))
 
             # Insurance payment
-            paid_match = re.search(r'Insurance Payment[^\$]*\$?([\d,]+\.?\d*)', text)
+            paid_match = INSURANCE_PAYMENT_RE.search(text)
             if paid_match:
-                bills["total_paid"] += float(paid_match.group(1).replace(',', ''))
+                paid.append(paid_match.group(1))
 
             # Amount due
-            due_match = re.search(r'Amount Due[:\s]+\$?([\d,]+\.?\d*)', text)
+            due_match = AMOUNT_DUE_RE.search(text)
             if due_match:
-                bills["total_owed"] += float(due_match.group(1).replace(',', ''))
+                owed.append(due_match.group(1))
 
             # Liens
-            lien_match = re.search(r'lien[^\$]*\$?([\d,]+\.?\d*)', text, re.IGNORECASE)
+            lien_match = LIEN_RE.search(text)
             if lien_match:
                 bills["liens"].append({
                     "provider": "Bellevue Hospital Center",
-                    "amount": float(lien_match.group(1).replace(',', ''))
+                    "amount": _parse_amount(lien_match.group(1))
                 })
 
             # CPT codes
-            cpt_matches = re.findall(r'(\d{5})\s+[A-Z]', text)
-            bills["cpt_codes"].extend(cpt_matches)
+            cpt_codes.update(m.group(1) for m in CPT_RE.finditer(text))
+
+        # Convert the captured amounts in one batch per total
+        bills["total_charges"] = _sum_amounts(charges)
+        bills["total_paid"] = _sum_amounts(paid)
+        bills["total_owed"] = _sum_amounts(owed)
 
-        bills["cpt_codes"] = list(set(bills["cpt_codes"]))
+        bills["cpt_codes"] = list(cpt_codes)
         return bills
 
+    @cached
     def extract_insurance_coverage(self) -> Dict[str, Any]:
         """Extract insurance coverage information"""
         coverage = {
@@ -246,33 +523,32 @@ class AWSResultsAggregator:
             }
 
             # Carrier
-            if "STATE FARM" in text:
-                policy_info["carrier"] = "State Farm"
-            elif "Progressive" in text:
-                policy_info["carrier"] = "Progressive"
+            policy_info["carrier"] = next(
+                (carrier for marker, carrier in CARRIERS if marker in text), ""
+            )
 
             # Policy number
-            policy_match = re.search(r'Policy Number[:\s]+([^\s]+)', text)
+            policy_match = POLICY_NUMBER_RE.search(text)
             if policy_match:
                 policy_info["policy_number"] = policy_match.group(1)
 
             # BI limits
-            bi_match = re.search(r'Bodily Injury Liability\s+\$?([\d,]+)[^\$]*\$?([\d,]+)', text)
+            bi_match = BI_LIMITS_RE.search(text)
             if bi_match:
                 policy_info["bi_limits"] = f"${bi_match.group(1)}/{bi_match.group(2)}"
 
             # PIP
-            pip_match = re.search(r'Personal Injury Protection[^\$]*\$?([\d,]+)', text)
+            pip_match = PIP_RE.search(text)
             if pip_match:
                 policy_info["pip_limits"] = f"${pip_match.group(1)}"
                 if "State Farm" in text:
-                    coverage["pip_available"] = float(pip_match.group(1).replace(',', ''))
+                    coverage["pip_available"] = _parse_amount(pip_match.group(1))
 
             # SUM
-            sum_match = re.search(r'Underinsured Motorist[^\$]*\$?([\d,]+)[^\$]*\$?([\d,]+)', text)
+            sum_match = SUM_RE.search(text)
             if sum_match:
                 policy_info["sum_limits"] = f"${sum_match.group(1)}/{sum_match.group(2)}"
-                coverage["sum_available"] = float(sum_match.group(1).replace(',', ''))
+                coverage["sum_available"] = _parse_amount(sum_match.group(1))
 
             # Assign to plaintiff or defendant
             if "State Farm" in text and "Maria" in text:
@@ -285,6 +561,7 @@ class AWSResultsAggregator:
 
         return coverage
 
+    @cached
     def analyze_liability(self) -> Dict[str, Any]:
         """Analyze liability based on police report"""
         liability = {
@@ -297,26 +574,29 @@ class AWSResultsAggregator:
         for text in self.police_reports_text:
             # Fault determination
             if "AT FAULT" in text:
-                fault_match = re.search(r'([A-Z][a-z]+\s+[A-Z][a-z]+)[^\n]*(?:is determined to be|determined)\s+AT FAULT', text)
+                fault_match = AT_FAULT_RE.search(text)
                 if fault_match:
                     liability["fault_determination"] = f"{fault_match.group(1)} determined AT FAULT"
 
+            keywords = {match.lastgroup for match in LIABILITY_KEYWORDS_RE.finditer(text)}
+
             # Contributing factors
-            if "red light" in text.lower() or "red traffic signal" in text.lower():
+            if "red_light" in keywords:
                 liability["contributing_factors"].append("Ran red light")
-            if "cell phone" in text.lower() or "mobile telephone" in text.lower():
+            if "cell_phone" in keywords:
                 liability["contributing_factors"].append("Distracted driving (cell phone)")
 
             # Evidence
-            if "traffic camera" in text.lower():
+            if "camera" in keywords:
                 liability["evidence"].append("Traffic camera footage")
-            if "witness" in text.lower():
-                witness_count = len(re.findall(r'\d+\.\s+[A-Z][a-z]+\s+[A-Z][a-z]+,\s+(?:pedestrian|driver)', text))
+            if "witness" in keywords:
+                witness_count = sum(1 for _ in WITNESS_RE.finditer(text))
                 if witness_count > 0:
                     liability["evidence"].append(f"{witness_count} witness statements")
 
         return liability
 
+    @cached
     def analyze_ny_serious_injury(self) -> Dict[str, Any]:
         """Analyze NY Insurance Law 5102(d) serious injury threshold"""
         analysis = {
@@ -326,26 +606,33 @@ class AWSResultsAggregator:
             "notes": ""
         }
 
-        all_text = " ".join(self.medical_records_text)
+        # Scan each record once, using the lowercase copies made at load time
+        work_restricted = limited = rom_documented = disc_pathology = radiculopathy = False
+        for text, text_lower in zip(self.medical_records_text, self.medical_records_text_lower):
+            work_restricted = work_restricted or "no work" in text_lower or "unable to perform" in text_lower
+            limited = limited or "limited" in text_lower
+            rom_documented = rom_documented or "ROM" in text or "range of motion" in text_lower
+            disc_pathology = disc_pathology or "disc bulging" in text_lower or "herniation" in text_lower
+            radiculopathy = radiculopathy or "radiculopathy" in text_lower
 
         # Check for 90/180 day rule
-        if "no work" in all_text.lower() or "unable to perform" in all_text.lower():
+        if work_restricted:
             analysis["threshold_categories"].append("90/180 Day Rule - Substantial limitation of daily activities")
             analysis["supporting_evidence"].append("Work restriction documented")
 
         # Check for significant limitation of body function
-        if "limited" in all_text.lower() and ("ROM" in all_text or "range of motion" in all_text.lower()):
+        if limited and rom_documented:
             analysis["threshold_categories"].append("Significant limitation of use of body function/system")
-            rom_match = re.search(r'(?:flexion|extension)\s+limited\s+to\s+(\d+)\s+degrees', all_text, re.IGNORECASE)
+            rom_match = next(filter(None, map(ROM_LIMITED_RE.search, self.medical_records_text)), None)
             if rom_match:
                 analysis["supporting_evidence"].append(f"Range of motion limited to {rom_match.group(1)} degrees")
 
         # Check for permanent injury indicators
-        if "disc bulging" in all_text.lower() or "herniation" in all_text.lower():
+        if disc_pathology:
             analysis["threshold_categories"].append("Permanent consequential limitation")
             analysis["supporting_evidence"].append("Disc pathology documented on imaging")
 
-        if "radiculopathy" in all_text.lower():
+        if radiculopathy:
             analysis["supporting_evidence"].append("Radiculopathy diagnosis")
 
         analysis["meets_threshold"] = len(analysis["threshold_categories"]) > 0
@@ -357,6 +644,7 @@ class AWSResultsAggregator:
 
         return analysis
 
+    @cached
     def calculate_damages(self) -> Dict[str, Any]:
         """Calculate special damages"""
         bills = self.extract_medical_bills()
@@ -433,120 +721,107 @@ class AWSResultsAggregator:
 
     def generate_markdown_report(self, summary: Dict[str, Any]) -> str:
         """Generate a formatted markdown report"""
-        report = f"""# NY Personal Injury Case Summary
-## Case ID: {summary['case_id']}
-Generated: {summary['generated_date']}
-
----
-
-## Plaintiff Information
-- **Name:** {summary['plaintiff']['name']}
-- **Date of Birth:** {summary['plaintiff']['dob']}
-- **Address:** {summary['plaintiff']['address']}
-
-## Defendant (At-Fault Party)
-- **Name:** {summary['defendant']['name']}
-- **Vehicle:** {summary['defendant']['vehicle']}
-- **Insurance:** {summary['defendant']['insurance']}
-- **Violations Issued:**
-"""
-        for v in summary['defendant']['violations']:
-            report += f"  - {v}\n"
-
-        report += f"""
-## Accident Details
-- **Date:** {summary['accident']['date']}
-- **Time:** {summary['accident']['time']}
-- **Location:** {summary['accident']['location']}
-- **Report Number:** {summary['accident']['report_number']}
-
-**Description:**
-{summary['accident']['description']}
-
-## Injuries & Diagnoses
-**Body Parts Affected:**
-"""
-        for bp in summary['injuries']['body_parts']:
-            report += f"- {bp}\n"
-
-        report += "\n**Diagnoses:**\n"
-        for d in summary['injuries']['diagnoses']:
-            report += f"- {d}\n"
-
-        report += "\n**ICD-10 Codes:**\n"
-        for code in summary['injuries']['icd_codes']:
-            report += f"- {code}\n"
+        plaintiff_policy = summary['insurance_coverage']['plaintiff_policy']
+        liens = summary['medical_bills']['liens']
+        ny = summary['ny_serious_injury_analysis']
+
+        fields = {
+            "case_id": summary['case_id'],
+            "generated_date": summary['generated_date'],
+            "plaintiff_name": summary['plaintiff']['name'],
+            "plaintiff_dob": summary['plaintiff']['dob'],
+            "plaintiff_address": summary['plaintiff']['address'],
+            "defendant_name": summary['defendant']['name'],
+            "defendant_vehicle": summary['defendant']['vehicle'],
+            "defendant_insurance": summary['defendant']['insurance'],
+            "violations": _bullets(summary['defendant']['violations'], "  - "),
+            "accident_date": summary['accident']['date'],
+            "accident_time": summary['accident']['time'],
+            "accident_location": summary['accident']['location'],
+            "report_number": summary['accident']['report_number'],
+            "accident_description": summary['accident']['description'],
+            "body_parts": _bullets(summary['injuries']['body_parts']),
+            "diagnoses": _bullets(summary['injuries']['diagnoses']),
+            "icd_codes": _bullets(summary['injuries']['icd_codes']),
+            "work_restrictions": summary['injuries']['work_restrictions'],
+            "total_charges": summary['medical_bills']['total_charges'],
+            "total_paid": summary['medical_bills']['total_paid'],
+            "total_owed": summary['medical_bills']['total_owed'],
+            "liens": "\n**Medical Liens:**\n" + "".join(
+                f"- {lien['provider']}: ${lien['amount']:,.2f}\n" for lien in liens
+            ) if liens else "",
+            "plaintiff_carrier": plaintiff_policy.get('carrier', 'N/A'),
+            "plaintiff_policy_number": plaintiff_policy.get('policy_number', 'N/A'),
+            "plaintiff_bi_limits": plaintiff_policy.get('bi_limits', 'N/A'),
+            "plaintiff_pip_limits": plaintiff_policy.get('pip_limits', 'N/A'),
+            "plaintiff_sum_limits": plaintiff_policy.get('sum_limits', 'N/A'),
+            "pip_available": summary['insurance_coverage']['pip_available'],
+            "sum_available": summary['insurance_coverage']['sum_available'],
+            "fault_determination": summary['liability_analysis']['fault_determination'],
+            "contributing_factors": _bullets(summary['liability_analysis']['contributing_factors']),
+            "evidence": _bullets(summary['liability_analysis']['evidence']),
+            "meets_threshold": 'YES' if ny['meets_threshold'] else 'NEEDS REVIEW',
+            "threshold_categories": _bullets(ny['threshold_categories']),
+            "supporting_evidence": _bullets(ny['supporting_evidence']),
+            "ny_notes": ny['notes'],
+            "recommended_actions": "".join(
+                f"{i}. {action}\n" for i, action in enumerate(summary['recommended_actions'], 1)
+            ),
+        }
 
-        report += f"\n**Work Restrictions:** {summary['injuries']['work_restrictions']}\n"
+        return MARKDOWN_REPORT_TEMPLATE.format_map(fields)
 
-        report += f"""
-## Medical Bills & Special Damages
-| Category | Amount |
-|----------|--------|
-| Total Billed | ${summary['medical_bills']['total_charges']:,.2f} |
-| Paid by Insurance | ${summary['medical_bills']['total_paid']:,.2f} |
-| Outstanding Balance | ${summary['medical_bills']['total_owed']:,.2f} |
-"""
+    def save_outputs(self, summary: Dict[str, Any], output: str) -> Tuple[str, str]:
+        """Save the JSON summary and Markdown report as <output>.json and <output>.md"""
+        json_path = f"{output}.json"
+        _write_json(json_path, summary)
 
-        if summary['medical_bills']['liens']:
-            report += "\n**Medical Liens:**\n"
-            for lien in summary['medical_bills']['liens']:
-                report += f"- {lien['provider']}: ${lien['amount']:,.2f}\n"
+        md_path = f"{output}.md"
+        with open(md_path, 'w') as f:
+            f.write(self.generate_markdown_report(summary))
 
-        report += f"""
-## Insurance Coverage
-### Plaintiff's Policy ({summary['insurance_coverage']['plaintiff_policy'].get('carrier', 'N/A')})
-- Policy #: {summary['insurance_coverage']['plaintiff_policy'].get('policy_number', 'N/A')}
-- BI Limits: {summary['insurance_coverage']['plaintiff_policy'].get('bi_limits', 'N/A')}
-- PIP: {summary['insurance_coverage']['plaintiff_policy'].get('pip_limits', 'N/A')}
-- SUM: {summary['insurance_coverage']['plaintiff_policy'].get('sum_limits', 'N/A')}
+        return json_path, md_path
 
-**Available Coverage:**
-- PIP Available: ${summary['insurance_coverage']['pip_available']:,.2f}
-- SUM Available: ${summary['insurance_coverage']['sum_available']:,.2f}
 
-## Liability Analysis
-**Fault Determination:** {summary['liability_analysis']['fault_determination']}
+def _case_name(results_folder: str) -> str:
+    """Name a case after its folder, or the parent of an aws_results folder"""
+    path = Path(results_folder).resolve()
+    return path.parent.name if path.name == "aws_results" else path.name
 
-**Contributing Factors:**
-"""
-        for f in summary['liability_analysis']['contributing_factors']:
-            report += f"- {f}\n"
 
-        report += "\n**Evidence:**\n"
-        for e in summary['liability_analysis']['evidence']:
-            report += f"- {e}\n"
+def _aggregate_case(results_folder: str, output: str) -> str:
+    """Aggregate one results folder and save its reports (process pool worker)"""
+    aggregator = AWSResultsAggregator(results_folder)
+    aggregator.save_outputs(aggregator.generate_summary(), output)
+    return output
 
-        report += f"""
-## NY Serious Injury Analysis (Insurance Law 5102(d))
-**Meets Threshold:** {'YES' if summary['ny_serious_injury_analysis']['meets_threshold'] else 'NEEDS REVIEW'}
 
-**Threshold Categories Met:**
-"""
-        for cat in summary['ny_serious_injury_analysis']['threshold_categories']:
-            report += f"- {cat}\n"
+def process_many(results_folders: List[str], output_dir: str,
+                 workers: Optional[int] = None) -> Dict[str, str]:
+    """
+    Aggregate several results folders in parallel worker processes.
 
-        report += "\n**Supporting Evidence:**\n"
-        for ev in summary['ny_serious_injury_analysis']['supporting_evidence']:
-            report += f"- {ev}\n"
+    Extraction is CPU bound, so each case runs in its own process. Reports
+    are saved as <output_dir>/<case name>.json and .md.
 
-        report += f"\n**Notes:** {summary['ny_serious_injury_analysis']['notes']}\n"
+    Args:
+        results_folders: Paths to AWS results folders, one per case
+        output_dir: Directory to save the reports in
+        workers: Number of worker processes (defaults to the CPU count)
 
-        report += """
-## Recommended Actions
-"""
-        for i, action in enumerate(summary['recommended_actions'], 1):
-            report += f"{i}. {action}\n"
+    Returns:
+        Dictionary mapping each results folder to its output base path
+    """
+    outputs = [os.path.join(output_dir, _case_name(folder)) for folder in results_folders]
+    if len(set(outputs)) != len(outputs):
+        raise ValueError("Results folders must have distinct case names")
 
-        report += """
----
-*This summary was automatically generated from IDP-extracted documents.*
-"""
-        return report
+    os.makedirs(output_dir, exist_ok=True)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(results_folders, executor.map(_aggregate_case, results_folders, outputs)))
 
 
 def main():
-    import argparse
     parser = argparse.ArgumentParser(description='Aggregate AWS IDP results for PI case')
     parser.add_argument('results_folder', help='Path to AWS results folder')
     parser.add_argument('--output', '-o', help='Output file path', default='case_summary')
@@ -555,17 +830,8 @@ def main():
     aggregator = AWSResultsAggregator(args.results_folder)
     summary = aggregator.generate_summary()
 
-    # Save JSON
-    json_path = f"{args.output}.json"
-    with open(json_path, 'w') as f:
-        json.dump(summary, f, indent=2)
+    json_path, md_path = aggregator.save_outputs(summary, args.output)
     print(f"JSON summary saved to: {json_path}")
-
-    # Save Markdown
-    md_path = f"{args.output}.md"
-    md_report = aggregator.generate_markdown_report(summary)
-    with open(md_path, 'w') as f:
-        f.write(md_report)
     print(f"Markdown report saved to: {md_path}")
 
     return summary
@@ -6,32 +6,216 @@ Generates professional demand letters from case summary JSON data.
 Supports configurable law firm branding and auto-calculated demand amounts.
 """
 
+import functools
+import hashlib
 import json
+import os
 import re
+import shutil
+from collections import ChainMap
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple
-from enum import Enum
+from itertools import chain, islice, repeat
+from typing import Callable, Dict, List, Any, Mapping, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:  # optional C-accelerated JSON parser and encoder
+    orjson = None
 
-class InjurySeverity(Enum):
-    """Injury severity classifications for demand calculation."""
-    PERMANENT = "permanent"
-    DISC_HERNIATION = "disc_herniation"
-    RADICULOPATHY = "radiculopathy"
-    DISC_BULGING = "disc_bulging"
-    SOFT_TISSUE = "soft_tissue"
+# Shared read-only default for missing case and config sections
+EMPTY_SECTION: Mapping[str, Any] = MappingProxyType({})
 
+# Injury severity classifications for demand calculation
+SEVERITY_PERMANENT = "permanent"
+SEVERITY_DISC_HERNIATION = "disc_herniation"
+SEVERITY_RADICULOPATHY = "radiculopathy"
+SEVERITY_DISC_BULGING = "disc_bulging"
+SEVERITY_SOFT_TISSUE = "soft_tissue"
 
 # Multiplier ranges by injury severity
 SEVERITY_MULTIPLIERS = {
-    InjurySeverity.PERMANENT: (3.0, 5.0),
-    InjurySeverity.DISC_HERNIATION: (2.5, 4.0),
-    InjurySeverity.RADICULOPATHY: (2.5, 3.5),
-    InjurySeverity.DISC_BULGING: (2.0, 3.0),
-    InjurySeverity.SOFT_TISSUE: (1.5, 2.5),
+    SEVERITY_PERMANENT: (3.0, 5.0),
+    SEVERITY_DISC_HERNIATION: (2.5, 4.0),
+    SEVERITY_RADICULOPATHY: (2.5, 3.5),
+    SEVERITY_DISC_BULGING: (2.0, 3.0),
+    SEVERITY_SOFT_TISSUE: (1.5, 2.5),
 }
 
+# Single-pass keyword scan over injury text, classified by the group that matched
+SEVERITY_KEYWORDS_RE = re.compile(
+    r'(?P<permanent>permanent|chronic|irreversible|uncertain recovery)'
+    r'|(?P<herniation>herniation|herniated)'
+    r'|(?P<radiculopathy>radiculopathy)'
+    r'|(?P<bulging>bulging|bulge|protrusion)',
+    re.IGNORECASE
+)
+# Groups that only count when found in the imaging findings
+IMAGING_ONLY_GROUPS = frozenset(('herniation', 'bulging'))
+# Fault determination wording that places fault on the defendant
+FAULT_KEYWORDS_RE = re.compile(r'100%|at fault|driver 2', re.IGNORECASE)
+# Single-pass scan of liability evidence, classified by the group that matched
+EVIDENCE_KEYWORDS_RE = re.compile(r'(?P<camera>camera|video)|(?P<witness>witness)', re.IGNORECASE)
+
+# Thousands separators stripped from amounts before int()
+AMOUNT_SEPARATORS = str.maketrans('', '', ',')
+# Policy number embedded in a defendant insurance string such as 'Geico Policy #AB-123'
+POLICY_NUMBER_RE = re.compile(r'#([A-Z0-9\-]+)')
+
+# Page shell for generate_html; %s placeholders are the title name and the body.
+# Plain %-formatting keeps the CSS braces unescaped.
+DEMAND_LETTER_HTML_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Demand Letter - %s</title>
+    <style>
+        @page {
+            margin: 1in;
+            size: letter;
+        }
+        @media print {
+            .no-print { display: none; }
+            body { font-size: 11pt; }
+        }
+        body {
+            font-family: 'Times New Roman', Times, serif;
+            font-size: 12pt;
+            line-height: 1.6;
+            max-width: 8.5in;
+            margin: 0 auto;
+            padding: 0.5in;
+            color: #000;
+        }
+        h2 {
+            font-size: 14pt;
+            margin-top: 1.5em;
+            margin-bottom: 0.5em;
+            border-bottom: 1px solid #ccc;
+            padding-bottom: 0.25em;
+        }
+        h3 {
+            font-size: 12pt;
+            margin-top: 1em;
+        }
+        table {
+            border-collapse: collapse;
+            width: 100%%;
+            margin: 1em 0;
+        }
+        th, td {
+            border: 1px solid #000;
+            padding: 8px 12px;
+            text-align: left;
+        }
+        th {
+            background-color: #f0f0f0;
+            font-weight: bold;
+        }
+        td:nth-child(n+2) {
+            text-align: right;
+        }
+        .letterhead {
+            text-align: center;
+            margin-bottom: 2em;
+            padding-bottom: 1em;
+            border-bottom: 2px solid #000;
+        }
+        .letterhead strong {
+            font-size: 16pt;
+        }
+        hr {
+            border: none;
+            border-top: 2px solid #000;
+            margin: 1em 0;
+        }
+        ul {
+            margin: 0.5em 0;
+            padding-left: 2em;
+        }
+        li {
+            margin: 0.25em 0;
+        }
+        em {
+            font-style: italic;
+        }
+        strong {
+            font-weight: bold;
+        }
+        code {
+            font-family: monospace;
+            background: #f5f5f5;
+            padding: 0.1em 0.3em;
+        }
+        .signature-block {
+            margin-top: 2em;
+        }
+    </style>
+</head>
+<body>
+%s
+</body>
+</html>"""
+
+# Inline markup inside a header or another span. An em span steps over nested
+# bold spans, and no span closes on a marker followed by a lone '*', so '***x***'
+# and '*a **b** c*' nest instead of closing early.
+MARKDOWN_SPAN_PATTERN = (
+    r'\*\*(?P<strong>.+?)\*\*(?!\*(?!\*))'
+    r'|\*(?P<em>(?:\*\*.+?\*\*|[^*\n])+?)\*(?!\*(?!\*))'
+    r'|`(?P<code>.+?)`'
+)
+MARKDOWN_SPAN_RE = re.compile(MARKDOWN_SPAN_PATTERN)
+
+# Headers and inline markup for _markdown_to_html, converted in one pass
+MARKDOWN_INLINE_RE = re.compile(
+    r'^## (?P<h2>.+)$'
+    r'|^### (?P<h3>.+)$'
+    r'|' + MARKDOWN_SPAN_PATTERN,
+    re.MULTILINE
+)
+
+# Markdown table separator row such as |---|---:|
+TABLE_SEPARATOR_RE = re.compile(r'\|[\s\-:|]+\|')
+
+# Rendered letters are cached in a folder of their own, named by _cache_key()
+CACHE_DIR_NAME = '.demand_letter_cache'
+CACHE_ENTRY_RE = re.compile(r'[0-9a-f]{64}\.(?:md|html)')
+
+
+@functools.lru_cache(maxsize=None)
+def _generator_fingerprint() -> str:
+    """Hash of this module's source, so cached letters expire when the templates change."""
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+
+def _load_json(path: Path) -> Any:
+    """Parse a JSON file."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _canonical_json(data: Any) -> bytes:
+    """Serialize data with sorted keys and no whitespace."""
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(data, sort_keys=True, separators=(',', ':'), default=str).encode()
+
+
+def _markdown_inline(match: re.Match) -> str:
+    """Wrap a MARKDOWN_INLINE_RE match in its HTML tag, converting nested markup."""
+    tag = match.lastgroup
+    inner = match.group(tag)
+    # Only spans nest; a '## ' inside a header or span stays literal text
+    if '*' in inner or '`' in inner:
+        inner = MARKDOWN_SPAN_RE.sub(_markdown_inline, inner)
+    return f'<{tag}>{inner}</{tag}>'
+
 
 class DemandLetterGenerator:
     """
@@ -41,7 +225,7 @@ class DemandLetterGenerator:
     Output: Markdown and HTML demand letters
     """
 
-    # Default law firm config when none provided
+    # Default law firm config, used for any top-level key the firm config omits
     DEFAULT_CONFIG = {
         "firm_name": "[LAW FIRM NAME]",
         "firm_address": {
@@ -76,66 +260,164 @@ class DemandLetterGenerator:
         """
         self.case_summary_path = Path(case_summary_path)
         self.config_path = Path(config_path) if config_path else None
-        self.case_data: Dict = {}
-        self.firm_config: Dict = {}
         self.demand_calculation: Dict = {}
+        self._now: Optional[datetime] = None
+        self._today_str: str = ''
+        # Assigning indexes the empty sections, so section methods work before anything is loaded
+        self.case_data = {}
+        self.firm_config = {}
+
+    @property
+    def case_data(self) -> Dict:
+        return self._case_data
+
+    @case_data.setter
+    def case_data(self, data: Dict) -> None:
+        """Install case data (loaded or assigned by a caller) and re-index it."""
+        self._case_data = data
+        self._severity: Optional[str] = None
+        self._liability_strength: Optional[float] = None
+        self._demand_calculated = False
+        self._index_case_data()
+        self._case_loaded = bool(data)
+
+    @property
+    def firm_config(self) -> Mapping[str, Any]:
+        return self._firm_config
+
+    @firm_config.setter
+    def firm_config(self, config: Mapping[str, Any]) -> None:
+        """Install a firm config (loaded or assigned by a caller) and re-index it."""
+        self._firm_config = config
+        self._index_firm_config()
+        self._firm_loaded = bool(config)
+
+    def _ensure_loaded(self) -> None:
+        """Load whatever case data and firm config are still missing.
+
+        Data a caller filled in place (rather than assigned) is indexed as is,
+        so it is rendered instead of being replaced by a reload.
+        """
+        if not self._case_loaded:
+            if self._case_data:
+                self.case_data = self._case_data
+            else:
+                self.load_case_summary()
+        if not self._firm_loaded:
+            if self._firm_config:
+                self.firm_config = self._firm_config
+            else:
+                self.load_firm_config()
 
     def load_case_summary(self) -> None:
         """Load case summary JSON data."""
         if not self.case_summary_path.exists():
             raise FileNotFoundError(f"Case summary not found: {self.case_summary_path}")
 
-        with open(self.case_summary_path, 'r') as f:
-            self.case_data = json.load(f)
+        self.case_data = _load_json(self.case_summary_path)
+        self._case_loaded = True
+
+    def _index_case_data(self) -> None:
+        """Resolve the case sections the letter reads, so sections skip repeated lookups."""
+        data = self.case_data
+        self._plaintiff = data.get('plaintiff', EMPTY_SECTION)
+        self._accident = data.get('accident', EMPTY_SECTION)
+        self._defendant = data.get('defendant', EMPTY_SECTION)
+        self._defendant_policy = data.get('insurance_coverage', EMPTY_SECTION).get('defendant_policy', EMPTY_SECTION)
+        self._injuries = data.get('injuries', EMPTY_SECTION)
+        self._liability = data.get('liability_analysis', EMPTY_SECTION)
+        self._ny_serious = data.get('ny_serious_injury_analysis', EMPTY_SECTION)
+        self._bills = data.get('medical_bills', EMPTY_SECTION)
+
+    def load_firm_config(self, loaded: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Load law firm configuration, falling back to defaults for missing keys.
 
-    def load_firm_config(self) -> None:
-        """Load law firm configuration or use defaults."""
-        if self.config_path and self.config_path.exists():
-            with open(self.config_path, 'r') as f:
-                self.firm_config = json.load(f)
-        else:
-            self.firm_config = self.DEFAULT_CONFIG.copy()
+        Args:
+            loaded: Already parsed firm config to use instead of reading config_path
+        """
+        if loaded is None:
+            loaded = {}
+            if self.config_path and self.config_path.exists():
+                loaded = _load_json(self.config_path)
+        # Overlay rather than copy, so DEFAULT_CONFIG is never mutated through an instance
+        self.firm_config = ChainMap(loaded, self.DEFAULT_CONFIG)
+
+    def _index_firm_config(self) -> None:
+        """Resolve nested firm config values and render the firm-only fragments once."""
+        firm = self.firm_config
+        defaults = firm.get('defaults', EMPTY_SECTION)
+        addr = firm.get('firm_address', EMPTY_SECTION)
+        attorney = firm.get('attorney', EMPTY_SECTION)
+        self._response_deadline_days = defaults.get('response_deadline_days', 30)
+        self._cc_client = defaults.get('cc_client', True)
 
-    def classify_injury_severity(self) -> InjurySeverity:
+        self._letterhead_lines = (
+            f"**{firm.get('firm_name', '[LAW FIRM NAME]')}**",
+            f"{addr.get('street', '')}",
+            f"{addr.get('city', '')}, {addr.get('state', '')} {addr.get('zip', '')}",
+            f"Tel: {firm.get('firm_phone', '')} | Fax: {firm.get('firm_fax', '')}",
+            f"{firm.get('firm_email', '')}",
+            "",
+            "---",
+            ""
+        )
+        self._signature_lines = (
+            "Please do not hesitate to contact the undersigned with any questions.",
+            "",
+            "Very truly yours,",
+            "",
+            f"**{attorney.get('name', '[Attorney Name]')}**",
+            firm.get('firm_name', ''),
+            f"Tel: {attorney.get('direct_phone', '')}",
+            f"Email: {attorney.get('email', '')}",
+            ""
+        )
+
+    def classify_injury_severity(self) -> str:
         """
         Classify injury severity based on case data.
 
-        Returns highest applicable severity level.
+        Returns the SEVERITY_* constant of the highest applicable level.
         """
-        injuries = self.case_data.get('injuries', {})
+        if self._severity is not None:
+            return self._severity
+
+        injuries = self._injuries
         imaging = injuries.get('imaging_findings', [])
         diagnoses = injuries.get('diagnoses', [])
         prognosis = injuries.get('prognosis', '')
-        ny_serious = self.case_data.get('ny_serious_injury_analysis', {})
-        threshold_categories = ny_serious.get('threshold_categories', [])
-
-        # Combine all text for keyword searching
-        imaging_text = ' '.join(imaging).lower() if isinstance(imaging, list) else str(imaging).lower()
-        diagnoses_text = ' '.join(diagnoses).lower() if isinstance(diagnoses, list) else str(diagnoses).lower()
-        prognosis_lower = prognosis.lower()
-        all_text = f"{imaging_text} {diagnoses_text} {prognosis_lower}"
-
-        # Check for permanency indicators
-        permanent_keywords = ['permanent', 'chronic', 'irreversible', 'uncertain recovery']
-        if any(kw in all_text for kw in permanent_keywords):
-            # Confirm with NY serious injury threshold
-            if 'Permanent consequential limitation' in threshold_categories:
-                return InjurySeverity.PERMANENT
-
-        # Check imaging for herniation
-        if 'herniation' in imaging_text or 'herniated' in imaging_text:
-            return InjurySeverity.DISC_HERNIATION
-
-        # Check for radiculopathy
-        if 'radiculopathy' in all_text:
-            return InjurySeverity.RADICULOPATHY
-
-        # Check for disc bulging
-        if 'bulging' in imaging_text or 'bulge' in imaging_text or 'protrusion' in imaging_text:
-            return InjurySeverity.DISC_BULGING
+        threshold_categories = frozenset(self._ny_serious.get('threshold_categories', []))
+
+        # Combine all text for a single keyword scan; imaging comes first so
+        # imaging-only matches are those that start before its end
+        imaging_text = ' '.join(imaging) if isinstance(imaging, list) else str(imaging)
+        diagnoses_text = ' '.join(diagnoses) if isinstance(diagnoses, list) else str(diagnoses)
+        all_text = f"{imaging_text} {diagnoses_text} {prognosis}"
+        imaging_end = len(imaging_text)
+
+        found = set()
+        for match in SEVERITY_KEYWORDS_RE.finditer(all_text):
+            group = match.lastgroup
+            if group in IMAGING_ONLY_GROUPS and match.start() >= imaging_end:
+                continue
+            found.add(group)
+
+        # Permanency indicators, confirmed with NY serious injury threshold
+        if 'permanent' in found and 'Permanent consequential limitation' in threshold_categories:
+            severity = SEVERITY_PERMANENT
+        elif 'herniation' in found:
+            severity = SEVERITY_DISC_HERNIATION
+        elif 'radiculopathy' in found:
+            severity = SEVERITY_RADICULOPATHY
+        elif 'bulging' in found:
+            severity = SEVERITY_DISC_BULGING
+        else:
+            # Default to soft tissue
+            severity = SEVERITY_SOFT_TISSUE
 
-        # Default to soft tissue
-        return InjurySeverity.SOFT_TISSUE
+        self._severity = severity
+        return severity
 
     def calculate_liability_strength(self) -> float:
         """
@@ -144,32 +426,38 @@ class DemandLetterGenerator:
         Returns:
             Float between 0.0 (weak) and 1.0 (very strong)
         """
-        liability = self.case_data.get('liability_analysis', {})
+        if self._liability_strength is not None:
+            return self._liability_strength
+
+        liability = self._liability
 
         score = 0.5  # Start neutral
 
         # Fault determination
-        fault = liability.get('fault_determination', '').lower()
-        if '100%' in fault or 'at fault' in fault or 'driver 2' in fault:
+        if FAULT_KEYWORDS_RE.search(liability.get('fault_determination', '')):
             score += 0.2
 
         # Traffic violations
         violations = liability.get('violations', [])
         if not violations:
             # Check defendant info for violations
-            defendant = self.case_data.get('defendant', {})
-            violations = defendant.get('violations', [])
+            violations = self._defendant.get('violations', [])
 
         if violations:
             score += 0.1 * min(len(violations), 2)  # Up to 0.2 for violations
 
         # Evidence strength
         evidence = liability.get('evidence', [])
-        evidence_text = ' '.join(evidence).lower() if evidence else ''
+        found = set()
+        if evidence:
+            for match in EVIDENCE_KEYWORDS_RE.finditer(' '.join(evidence)):
+                found.add(match.lastgroup)
+                if len(found) == 2:
+                    break
 
-        if 'camera' in evidence_text or 'video' in evidence_text:
+        if 'camera' in found:
             score += 0.15
-        if 'witness' in evidence_text:
+        if 'witness' in found:
             score += 0.1
 
         # Contributing factors against defendant
@@ -177,7 +465,8 @@ class DemandLetterGenerator:
         if factors:
             score += 0.05 * min(len(factors), 2)
 
-        return min(1.0, max(0.0, score))
+        self._liability_strength = min(1.0, max(0.0, score))
+        return self._liability_strength
 
     def calculate_demand_amount(self) -> Dict[str, Any]:
         """
@@ -187,13 +476,12 @@ class DemandLetterGenerator:
             Dictionary with demand calculation details
         """
         # Get medical specials
-        bills = self.case_data.get('medical_bills', {})
-        total_specials = bills.get('total_charges', 0)
+        total_specials = self._bills.get('total_charges', 0)
 
         if total_specials == 0:
             # Try special_damages
-            special_damages = self.case_data.get('special_damages', {})
-            medical_expenses = special_damages.get('medical_expenses', {})
+            special_damages = self.case_data.get('special_damages', EMPTY_SECTION)
+            medical_expenses = special_damages.get('medical_expenses', EMPTY_SECTION)
             total_specials = medical_expenses.get('total_billed', 0)
 
         # Classify injury severity
@@ -221,8 +509,7 @@ class DemandLetterGenerator:
         total_demand = round(total_demand / 500) * 500
 
         # Get available coverage
-        coverage = self.case_data.get('insurance_coverage', {})
-        defendant_policy = coverage.get('defendant_policy', {})
+        defendant_policy = self._defendant_policy
 
         # Parse BI limits
         bi_limits_str = defendant_policy.get('bi_limits', '')
@@ -234,7 +521,7 @@ class DemandLetterGenerator:
 
         self.demand_calculation = {
             'total_specials': total_specials,
-            'severity_classification': severity.value,
+            'severity_classification': severity,
             'multiplier_range': (low_mult, high_mult),
             'multiplier_used': round(selected_mult, 2),
             'liability_strength': round(liability_strength, 2),
@@ -243,6 +530,7 @@ class DemandLetterGenerator:
             'defendant_bi_limit': defendant_bi,
             'exceeds_coverage': total_demand > defendant_bi if defendant_bi else None
         }
+        self._demand_calculated = True
 
         return self.demand_calculation
 
@@ -251,49 +539,54 @@ class DemandLetterGenerator:
         if not limits_str:
             return None
 
-        # Remove $ and commas, get first number
-        match = re.search(r'[\$]?([\d,]+)', limits_str)
-        if match:
-            return int(match.group(1).replace(',', ''))
-        return None
+        # First number is the run of digits and commas from the first digit
+        start = next((i for i, ch in enumerate(limits_str) if ch.isdecimal()), None)
+        if start is None:
+            return None
+        end = start + 1
+        while end < len(limits_str) and (limits_str[end].isdecimal() or limits_str[end] == ','):
+            end += 1
+        return int(limits_str[start:end].translate(AMOUNT_SEPARATORS))
 
     # === Content Generation Methods ===
 
+    def _date_letter(self) -> None:
+        """Fix the letter date once so every section formats the same moment."""
+        self._now = datetime.now()
+        self._today_str = self._now.strftime("%B %d, %Y")
+
+    def _render(self, emit: Callable[[List[str]], None]) -> str:
+        """Run a single section emitter and return its text."""
+        lines: List[str] = []
+        emit(lines)
+        return '\n'.join(lines)
+
     def generate_letterhead(self) -> str:
         """Generate law firm letterhead."""
-        firm = self.firm_config
-        addr = firm.get('firm_address', {})
-        attorney = firm.get('attorney', {})
+        return self._render(self._emit_letterhead)
 
-        lines = [
-            f"**{firm.get('firm_name', '[LAW FIRM NAME]')}**",
-            f"{addr.get('street', '')}",
-            f"{addr.get('city', '')}, {addr.get('state', '')} {addr.get('zip', '')}",
-            f"Tel: {firm.get('firm_phone', '')} | Fax: {firm.get('firm_fax', '')}",
-            f"{firm.get('firm_email', '')}",
-            "",
-            "---",
-            ""
-        ]
-        return '\n'.join(lines)
+    def _emit_letterhead(self, lines: List[str]) -> None:
+        """Append law firm letterhead to lines."""
+        lines.extend(self._letterhead_lines)
 
     def generate_date_and_addressee(self) -> str:
         """Generate date and insurance carrier address block."""
-        today = datetime.now().strftime("%B %d, %Y")
+        return self._render(self._emit_date_and_addressee)
 
-        # Get defendant insurance info
-        coverage = self.case_data.get('insurance_coverage', {})
-        defendant_policy = coverage.get('defendant_policy', {})
+    def _emit_date_and_addressee(self, lines: List[str]) -> None:
+        """Append date and insurance carrier address block to lines."""
+        if self._now is None:
+            self._date_letter()
 
-        # Also check defendant info
-        defendant = self.case_data.get('defendant', {})
+        # Get defendant insurance info, falling back to the defendant block
+        defendant = self._defendant
 
-        carrier = defendant_policy.get('carrier', '')
+        carrier = self._defendant_policy.get('carrier', '')
         if not carrier:
             carrier = defendant.get('insurance', '').split(' Policy')[0] if defendant.get('insurance') else '[INSURANCE CARRIER]'
 
-        lines = [
-            today,
+        lines.extend([
+            self._today_str,
             "",
             "**VIA CERTIFIED MAIL AND REGULAR MAIL**",
             "",
@@ -301,19 +594,19 @@ class DemandLetterGenerator:
             carrier,
             "[Claims Address]",
             ""
-        ]
-        return '\n'.join(lines)
+        ])
 
     def generate_re_line(self) -> str:
         """Generate Re: line with claim details."""
-        plaintiff = self.case_data.get('plaintiff', {})
-        accident = self.case_data.get('accident', {})
-        defendant = self.case_data.get('defendant', {})
-        coverage = self.case_data.get('insurance_coverage', {})
-        defendant_policy = coverage.get('defendant_policy', {})
+        return self._render(self._emit_re_line)
 
-        plaintiff_name = plaintiff.get('name', '[CLAIMANT NAME]')
-        accident_date = accident.get('date', '[DATE OF LOSS]')
+    def _emit_re_line(self, lines: List[str]) -> None:
+        """Append Re: line with claim details to lines."""
+        defendant = self._defendant
+        defendant_policy = self._defendant_policy
+
+        plaintiff_name = self._plaintiff.get('name', '[CLAIMANT NAME]')
+        accident_date = self._accident.get('date', '[DATE OF LOSS]')
 
         # Get claim/policy numbers
         claim_number = defendant_policy.get('claim_number', '[CLAIM NUMBER]')
@@ -321,12 +614,12 @@ class DemandLetterGenerator:
         if not policy_number:
             # Try to extract from defendant insurance string
             ins = defendant.get('insurance', '')
-            match = re.search(r'#([A-Z0-9\-]+)', ins)
+            match = POLICY_NUMBER_RE.search(ins)
             policy_number = match.group(1) if match else '[POLICY NUMBER]'
 
         defendant_name = defendant.get('name', '[INSURED NAME]')
 
-        lines = [
+        lines.extend([
             f"**Re:** Claimant: {plaintiff_name}",
             f"       Date of Loss: {accident_date}",
             f"       Claim Number: {claim_number}",
@@ -335,27 +628,33 @@ class DemandLetterGenerator:
             "",
             "Dear Claims Representative:",
             ""
-        ]
-        return '\n'.join(lines)
+        ])
 
     def generate_introduction(self) -> str:
         """Generate introduction paragraph."""
-        plaintiff = self.case_data.get('plaintiff', {})
-        accident = self.case_data.get('accident', {})
+        return self._render(self._emit_introduction)
+
+    def _emit_introduction(self, lines: List[str]) -> None:
+        """Append introduction paragraph to lines."""
+        accident = self._accident
 
-        plaintiff_name = plaintiff.get('name', '[CLIENT NAME]')
+        plaintiff_name = self._plaintiff.get('name', '[CLIENT NAME]')
         accident_date = accident.get('date', '[DATE]')
         location = accident.get('location', '[LOCATION]')
 
-        return f"""## Introduction
+        lines.append(f"""## Introduction
 
 This firm represents **{plaintiff_name}** for injuries sustained in a motor vehicle collision that occurred on **{accident_date}** at **{location}**. This letter serves as a formal demand for settlement of our client's bodily injury claim.
 
-"""
+""")
 
     def generate_facts_section(self) -> str:
         """Generate facts of accident section."""
-        accident = self.case_data.get('accident', {})
+        return self._render(self._emit_facts_section)
+
+    def _emit_facts_section(self, lines: List[str]) -> None:
+        """Append facts of accident section to lines."""
+        accident = self._accident
 
         narrative = accident.get('description', '')
         if not narrative:
@@ -366,12 +665,12 @@ This firm represents **{plaintiff_name}** for injuries sustained in a motor vehi
         location = accident.get('location', '')
         report_num = accident.get('report_number', '')
 
-        lines = [
+        lines.extend([
             "## Facts of the Accident",
             "",
             f"On **{date}** at approximately **{time}**, a motor vehicle collision occurred at **{location}**.",
             ""
-        ]
+        ])
 
         if report_num:
             lines.append(f"*Police Report No. {report_num}*")
@@ -380,26 +679,27 @@ This firm represents **{plaintiff_name}** for injuries sustained in a motor vehi
         lines.append(narrative)
         lines.append("")
 
-        return '\n'.join(lines)
-
     def generate_liability_section(self) -> str:
         """Generate liability discussion section."""
-        liability = self.case_data.get('liability_analysis', {})
-        defendant = self.case_data.get('defendant', {})
+        return self._render(self._emit_liability_section)
+
+    def _emit_liability_section(self, lines: List[str]) -> None:
+        """Append liability discussion section to lines."""
+        liability = self._liability
 
         fault = liability.get('fault_determination', '')
-        violations = defendant.get('violations', [])
+        violations = self._defendant.get('violations', [])
         if not violations:
             violations = liability.get('violations', [])
         evidence = liability.get('evidence', [])
         factors = liability.get('contributing_factors', [])
 
-        lines = [
+        lines.extend([
             "## Liability",
             "",
             "Liability in this matter is clear and uncontested.",
             ""
-        ]
+        ])
 
         if fault:
             lines.append(f"**Fault Determination:** {fault}")
@@ -426,11 +726,13 @@ This firm represents **{plaintiff_name}** for injuries sustained in a motor vehi
         lines.append("Based on the foregoing, your insured bears 100% liability for this collision.")
         lines.append("")
 
-        return '\n'.join(lines)
-
     def generate_injuries_section(self) -> str:
         """Generate injuries and treatment section."""
-        injuries = self.case_data.get('injuries', {})
+        return self._render(self._emit_injuries_section)
+
+    def _emit_injuries_section(self, lines: List[str]) -> None:
+        """Append injuries and treatment section to lines."""
+        injuries = self._injuries
 
         diagnoses = injuries.get('diagnoses', [])
         body_parts = injuries.get('body_parts', [])
@@ -439,12 +741,12 @@ This firm represents **{plaintiff_name}** for injuries sustained in a motor vehi
         treatment_plan = injuries.get('treatment_plan', [])
         prognosis = injuries.get('prognosis', '')
 
-        lines = [
+        lines.extend([
             "## Injuries and Medical Treatment",
             "",
             "As a direct and proximate result of this collision, our client sustained the following injuries:",
             ""
-        ]
+        ])
 
         if body_parts:
             lines.append("**Body Parts Affected:**")
@@ -454,8 +756,8 @@ This firm represents **{plaintiff_name}** for injuries sustained in a motor vehi
 
         if diagnoses:
             lines.append("**Diagnoses:**")
-            for i, diag in enumerate(diagnoses):
-                icd = icd_codes[i] if i < len(icd_codes) else ""
+            # Pair each diagnosis with its ICD code, padding with "" when codes run out
+            for diag, icd in zip(diagnoses, chain(icd_codes, repeat(""))):
                 if icd:
                     lines.append(f"- {diag} (ICD-10: `{icd}`)")
                 else:
@@ -470,7 +772,7 @@ This firm represents **{plaintiff_name}** for injuries sustained in a motor vehi
 
         if treatment_plan:
             lines.append("**Treatment:**")
-            for treatment in treatment_plan[:5]:  # Limit to first 5
+            for treatment in islice(treatment_plan, 5):  # Limit to first 5
                 lines.append(f"- {treatment}")
             lines.append("")
 
@@ -479,11 +781,13 @@ This firm represents **{plaintiff_name}** for injuries sustained in a motor vehi
             lines.append(prognosis)
             lines.append("")
 
-        return '\n'.join(lines)
-
     def generate_specials_table(self) -> str:
         """Generate medical specials itemization table."""
-        bills = self.case_data.get('medical_bills', {})
+        return self._render(self._emit_specials_table)
+
+    def _emit_specials_table(self, lines: List[str]) -> None:
+        """Append medical specials itemization table to lines."""
+        bills = self._bills
 
         total_charges = bills.get('total_charges', 0)
         total_paid = bills.get('total_paid', 0)
@@ -492,25 +796,23 @@ This firm represents **{plaintiff_name}** for injuries sustained in a motor vehi
         liens = bills.get('liens', [])
         cpt_codes = bills.get('cpt_codes', [])
 
-        lines = [
+        lines.extend([
             "## Medical Specials Itemization",
             "",
             "| Provider | Total Charges | Paid | Balance |",
             "|----------|-------------:|-----:|--------:|"
-        ]
+        ])
 
         # If we have provider breakdown
         if providers:
             # Create a simple breakdown (in real implementation, would use line items)
-            charge_per_provider = total_charges / len(providers) if providers else 0
-            paid_per_provider = total_paid / len(providers) if providers else 0
-            balance_per_provider = total_owed / len(providers) if providers else 0
-
-            for provider in providers:
-                lines.append(
-                    f"| {provider} | ${charge_per_provider:,.2f} | "
-                    f"${paid_per_provider:,.2f} | ${balance_per_provider:,.2f} |"
-                )
+            # Every provider gets the same even split, so format the amounts once
+            count = len(providers)
+            amounts = (
+                f"${total_charges / count:,.2f} | "
+                f"${total_paid / count:,.2f} | ${total_owed / count:,.2f} |"
+            )
+            lines.extend(f"| {provider} | {amounts}" for provider in providers)
 
         # Totals row
         lines.append(
@@ -534,11 +836,13 @@ This firm represents **{plaintiff_name}** for injuries sustained in a motor vehi
             lines.append(f"*CPT Codes: {', '.join(cpt_codes[:8])}*")
             lines.append("")
 
-        return '\n'.join(lines)
-
     def generate_serious_injury_section(self) -> str:
         """Generate NY Serious Injury threshold section."""
-        ny_serious = self.case_data.get('ny_serious_injury_analysis', {})
+        return self._render(self._emit_serious_injury_section)
+
+    def _emit_serious_injury_section(self, lines: List[str]) -> None:
+        """Append NY Serious Injury threshold section to lines."""
+        ny_serious = self._ny_serious
 
         meets_threshold = ny_serious.get('meets_threshold', False)
         categories = ny_serious.get('threshold_categories', [])
@@ -546,14 +850,16 @@ This firm represents **{plaintiff_name}** for injuries sustained in a motor vehi
         notes = ny_serious.get('notes', '')
 
         if not meets_threshold and not categories:
-            return ""  # Skip section if not applicable
+            # Skip section if not applicable, keeping the blank separator line
+            lines.append("")
+            return
 
-        lines = [
+        lines.extend([
             "## NY Serious Injury Threshold (Insurance Law 5102(d))",
             "",
             f"Our client's injuries meet the serious injury threshold under New York Insurance Law 5102(d).",
             ""
-        ]
+        ])
 
         if categories:
             lines.append("**Threshold Categories Met:**")
@@ -567,17 +873,19 @@ This firm represents **{plaintiff_name}** for injuries sustained in a motor vehi
                 lines.append(f"- {ev}")
             lines.append("")
 
-        return '\n'.join(lines)
-
     def generate_damages_discussion(self) -> str:
         """Generate damages discussion section."""
-        injuries = self.case_data.get('injuries', {})
+        return self._render(self._emit_damages_discussion)
+
+    def _emit_damages_discussion(self, lines: List[str]) -> None:
+        """Append damages discussion section to lines."""
+        injuries = self._injuries
         prognosis = injuries.get('prognosis', '')
         work_restrictions = injuries.get('work_restrictions', '')
 
         severity = self.classify_injury_severity()
 
-        lines = [
+        lines.extend([
             "## Damages",
             "",
             "As a result of this collision, our client has endured significant pain and suffering, "
@@ -587,14 +895,14 @@ This firm represents **{plaintiff_name}** for injuries sustained in a motor vehi
             "- Emotional distress and anxiety",
             "- Interference with daily activities and quality of life",
             "- Medical treatment and rehabilitation",
-        ]
+        ])
 
         if work_restrictions:
             lines.append(f"- Lost time from work: {work_restrictions}")
 
         lines.append("")
 
-        if severity in [InjurySeverity.PERMANENT, InjurySeverity.DISC_HERNIATION]:
+        if severity in (SEVERITY_PERMANENT, SEVERITY_DISC_HERNIATION):
             lines.append(
                 "Given the permanent nature of our client's injuries and the documented "
                 "structural damage, the impact on our client's quality of life will continue indefinitely."
@@ -605,11 +913,13 @@ This firm represents **{plaintiff_name}** for injuries sustained in a motor vehi
             lines.append(f"*Prognosis: {prognosis}*")
             lines.append("")
 
-        return '\n'.join(lines)
-
     def generate_demand_section(self) -> str:
         """Generate demand amount section."""
-        if not self.demand_calculation:
+        return self._render(self._emit_demand_section)
+
+    def _emit_demand_section(self, lines: List[str]) -> None:
+        """Append demand amount section to lines."""
+        if not self._demand_calculated:
             self.calculate_demand_amount()
 
         calc = self.demand_calculation
@@ -620,10 +930,12 @@ This firm represents **{plaintiff_name}** for injuries sustained in a motor vehi
         severity = calc.get('severity_classification', '')
         defendant_bi = calc.get('defendant_bi_limit', 0)
 
-        deadline_days = self.firm_config.get('defaults', {}).get('response_deadline_days', 30)
-        deadline_date = (datetime.now() + timedelta(days=deadline_days)).strftime("%B %d, %Y")
+        deadline_days = self._response_deadline_days
+        if self._now is None:
+            self._date_letter()
+        deadline_date = (self._now + timedelta(days=deadline_days)).strftime("%B %d, %Y")
 
-        lines = [
+        lines.extend([
             "## Demand",
             "",
             "Based on the foregoing facts, injuries, and damages, we hereby demand the sum of "
@@ -635,7 +947,7 @@ This firm represents **{plaintiff_name}** for injuries sustained in a motor vehi
             f"| Pain and Suffering | ${pain_suffering:,.2f} |",
             f"| **TOTAL DEMAND** | **${total_demand:,.2f}** |",
             "",
-        ]
+        ])
 
         if defendant_bi and total_demand > defendant_bi:
             lines.append(
@@ -651,11 +963,13 @@ This firm represents **{plaintiff_name}** for injuries sustained in a motor vehi
             ""
         ])
 
-        return '\n'.join(lines)
-
     def generate_enclosures(self) -> str:
         """Generate enclosures list."""
-        lines = [
+        return self._render(self._emit_enclosures)
+
+    def _emit_enclosures(self, lines: List[str]) -> None:
+        """Append enclosures list to lines."""
+        lines.extend([
             "## Enclosures",
             "",
             "- Police Report",
@@ -663,261 +977,166 @@ This firm represents **{plaintiff_name}** for injuries sustained in a motor vehi
             "- Medical Bills",
             "- Photographs (if available)",
             ""
-        ]
-        return '\n'.join(lines)
+        ])
 
     def generate_closing(self) -> str:
         """Generate closing and signature block."""
-        attorney = self.firm_config.get('attorney', {})
-        firm_name = self.firm_config.get('firm_name', '')
-        cc_client = self.firm_config.get('defaults', {}).get('cc_client', True)
+        return self._render(self._emit_closing)
 
-        plaintiff = self.case_data.get('plaintiff', {})
-        plaintiff_name = plaintiff.get('name', '')
+    def _emit_closing(self, lines: List[str]) -> None:
+        """Append closing and signature block to lines."""
+        plaintiff_name = self._plaintiff.get('name', '')
 
-        lines = [
-            "Please do not hesitate to contact the undersigned with any questions.",
-            "",
-            "Very truly yours,",
-            "",
-            f"**{attorney.get('name', '[Attorney Name]')}**",
-            firm_name,
-            f"Tel: {attorney.get('direct_phone', '')}",
-            f"Email: {attorney.get('email', '')}",
-            ""
-        ]
+        lines.extend(self._signature_lines)
 
-        if cc_client and plaintiff_name:
+        if self._cc_client and plaintiff_name:
             lines.extend([
                 f"cc: {plaintiff_name} (Client)",
                 ""
             ])
 
-        return '\n'.join(lines)
-
     # === Output Methods ===
 
     def generate_markdown(self) -> str:
         """Generate complete demand letter in Markdown format."""
         # Ensure data is loaded
-        if not self.case_data:
-            self.load_case_summary()
-        if not self.firm_config:
-            self.load_firm_config()
+        self._ensure_loaded()
 
         # Calculate demand if not already done
-        if not self.demand_calculation:
+        if not self._demand_calculated:
             self.calculate_demand_amount()
 
-        sections = [
-            self.generate_letterhead(),
-            self.generate_date_and_addressee(),
-            self.generate_re_line(),
-            self.generate_introduction(),
-            self.generate_facts_section(),
-            self.generate_liability_section(),
-            self.generate_injuries_section(),
-            self.generate_specials_table(),
-            self.generate_serious_injury_section(),
-            self.generate_damages_discussion(),
-            self.generate_demand_section(),
-            self.generate_enclosures(),
-            self.generate_closing(),
-        ]
-
-        return '\n'.join(sections)
-
-    def generate_html(self) -> str:
-        """Generate complete demand letter in HTML format with styling."""
-        markdown_content = self.generate_markdown()
+        self._date_letter()
+
+        lines: List[str] = []
+        for emit in (
+            self._emit_letterhead,
+            self._emit_date_and_addressee,
+            self._emit_re_line,
+            self._emit_introduction,
+            self._emit_facts_section,
+            self._emit_liability_section,
+            self._emit_injuries_section,
+            self._emit_specials_table,
+            self._emit_serious_injury_section,
+            self._emit_damages_discussion,
+            self._emit_demand_section,
+            self._emit_enclosures,
+            self._emit_closing,
+        ):
+            emit(lines)
+
+        return '\n'.join(lines)
+
+    def generate_html(self, markdown_content: Optional[str] = None) -> str:
+        """
+        Generate complete demand letter in HTML format with styling.
+
+        Args:
+            markdown_content: Already generated Markdown letter to convert;
+                generated fresh when omitted
+        """
+        if markdown_content is None:
+            markdown_content = self.generate_markdown()
 
         # Convert markdown to simple HTML
         html_content = self._markdown_to_html(markdown_content)
 
-        plaintiff = self.case_data.get('plaintiff', {})
         case_id = self.case_data.get('case_id', 'demand_letter')
 
-        html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Demand Letter - {plaintiff.get('name', case_id)}</title>
-    <style>
-        @page {{
-            margin: 1in;
-            size: letter;
-        }}
-        @media print {{
-            .no-print {{ display: none; }}
-            body {{ font-size: 11pt; }}
-        }}
-        body {{
-            font-family: 'Times New Roman', Times, serif;
-            font-size: 12pt;
-            line-height: 1.6;
-            max-width: 8.5in;
-            margin: 0 auto;
-            padding: 0.5in;
-            color: #000;
-        }}
-        h2 {{
-            font-size: 14pt;
-            margin-top: 1.5em;
-            margin-bottom: 0.5em;
-            border-bottom: 1px solid #ccc;
-            padding-bottom: 0.25em;
-        }}
-        h3 {{
-            font-size: 12pt;
-            margin-top: 1em;
-        }}
-        table {{
-            border-collapse: collapse;
-            width: 100%;
-            margin: 1em 0;
-        }}
-        th, td {{
-            border: 1px solid #000;
-            padding: 8px 12px;
-            text-align: left;
-        }}
-        th {{
-            background-color: #f0f0f0;
-            font-weight: bold;
-        }}
-        td:nth-child(n+2) {{
-            text-align: right;
-        }}
-        .letterhead {{
-            text-align: center;
-            margin-bottom: 2em;
-            padding-bottom: 1em;
-            border-bottom: 2px solid #000;
-        }}
-        .letterhead strong {{
-            font-size: 16pt;
-        }}
-        hr {{
-            border: none;
-            border-top: 2px solid #000;
-            margin: 1em 0;
-        }}
-        ul {{
-            margin: 0.5em 0;
-            padding-left: 2em;
-        }}
-        li {{
-            margin: 0.25em 0;
-        }}
-        em {{
-            font-style: italic;
-        }}
-        strong {{
-            font-weight: bold;
-        }}
-        code {{
-            font-family: monospace;
-            background: #f5f5f5;
-            padding: 0.1em 0.3em;
-        }}
-        .signature-block {{
-            margin-top: 2em;
-        }}
-    </style>
-</head>
-<body>
-{html_content}
-</body>
-</html>"""
-        return html
+        return DEMAND_LETTER_HTML_TEMPLATE % (self._plaintiff.get('name', case_id), html_content)
 
     def _markdown_to_html(self, markdown: str) -> str:
         """Convert markdown to HTML (simple conversion)."""
-        html = markdown
-
-        # Headers
-        html = re.sub(r'^## (.+)$', r'<h2>\1</h2>', html, flags=re.MULTILINE)
-        html = re.sub(r'^### (.+)$', r'<h3>\1</h3>', html, flags=re.MULTILINE)
-
-        # Bold
-        html = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', html)
-
-        # Italic
-        html = re.sub(r'\*(.+?)\*', r'<em>\1</em>', html)
-
-        # Code
-        html = re.sub(r'`(.+?)`', r'<code>\1</code>', html)
+        # Headers, bold, italic and code
+        html = MARKDOWN_INLINE_RE.sub(_markdown_inline, markdown)
 
         # Horizontal rule
         html = html.replace('---', '<hr>')
 
-        # Tables
-        lines = html.split('\n')
-        in_table = False
-        new_lines = []
+        # Without table rows or list items every line is either a paragraph
+        # or passes through as-is
+        if '|' not in html and '- ' not in html:
+            return '\n'.join(
+                line if line.lstrip()[:1] in ('', '<') else f'<p>{line}</p>'
+                for line in html.split('\n')
+            )
+
+        # Tables, lists and paragraphs in one pass over the lines; open_block
+        # holds the closing tag of the table or list being built, if any, and
+        # paragraphs collects a run of consecutive paragraph lines
+        out: List[str] = []
+        open_block = None
+        header_pending = False
+        paragraphs: List[str] = []
 
-        for line in lines:
-            if line.strip().startswith('|') and '|' in line[1:]:
-                if not in_table:
-                    new_lines.append('<table>')
-                    in_table = True
+        for line in html.split('\n'):
+            # Classify the line by its first non-blank character
+            stripped = line.strip()
+            first = stripped[:1]
+            is_row = first == '|' and '|' in line[1:]
+            is_item = not is_row and first == '-' and stripped[1:2] == ' '
+
+            # Wrap a finished run of paragraphs with a single join
+            if paragraphs and (is_row or is_item or first in ('', '<', '|')):
+                out.append('<p>' + '</p>\n<p>'.join(paragraphs) + '</p>')
+                paragraphs.clear()
+
+            if is_row:
+                if open_block != '</table>':
+                    if open_block:
+                        out.append(open_block)
+                    out.append('<table>')
+                    open_block = '</table>'
+                    header_pending = True
 
                 # Skip separator line
-                if re.match(r'\|[\s\-:|]+\|', line):
+                if TABLE_SEPARATOR_RE.match(line):
                     continue
 
-                cells = [c.strip() for c in line.split('|')[1:-1]]
-                if new_lines[-1] == '<table>':
-                    # Header row
-                    row = '<tr>' + ''.join(f'<th>{c}</th>' for c in cells) + '</tr>'
+                # Cells lie between the first and last '|'
+                start = line.find('|') + 1
+                end = line.rfind('|')
+                if start > end:
+                    row = '<tr></tr>'
                 else:
-                    row = '<tr>' + ''.join(f'<td>{c}</td>' for c in cells) + '</tr>'
-                new_lines.append(row)
+                    cells = map(str.strip, line[start:end].split('|'))
+                    if header_pending:
+                        row = f'<tr><th>{"</th><th>".join(cells)}</th></tr>'
+                    else:
+                        row = f'<tr><td>{"</td><td>".join(cells)}</td></tr>'
+                header_pending = False
+                out.append(row)
+            elif is_item:
+                if open_block != '</ul>':
+                    if open_block:
+                        out.append(open_block)
+                    out.append('<ul>')
+                    open_block = '</ul>'
+                out.append(f'<li>{stripped[2:]}</li>')
             else:
-                if in_table:
-                    new_lines.append('</table>')
-                    in_table = False
-                new_lines.append(line)
-
-        if in_table:
-            new_lines.append('</table>')
-
-        html = '\n'.join(new_lines)
-
-        # Lists
-        lines = html.split('\n')
-        new_lines = []
-        in_list = False
-
-        for line in lines:
-            if line.strip().startswith('- '):
-                if not in_list:
-                    new_lines.append('<ul>')
-                    in_list = True
-                new_lines.append(f'<li>{line.strip()[2:]}</li>')
-            else:
-                if in_list:
-                    new_lines.append('</ul>')
-                    in_list = False
-                new_lines.append(line)
-
-        if in_list:
-            new_lines.append('</ul>')
+                if open_block:
+                    out.append(open_block)
+                    open_block = None
+                # Paragraphs (lines with content not already wrapped)
+                if first not in ('', '<', '|'):
+                    paragraphs.append(line)
+                else:
+                    out.append(line)
 
-        html = '\n'.join(new_lines)
+        if open_block:
+            out.append(open_block)
+        elif paragraphs:
+            out.append('<p>' + '</p>\n<p>'.join(paragraphs) + '</p>')
 
-        # Paragraphs (lines with content not already wrapped)
-        lines = html.split('\n')
-        new_lines = []
-        for line in lines:
-            stripped = line.strip()
-            if stripped and not stripped.startswith('<') and not stripped.startswith('|'):
-                new_lines.append(f'<p>{line}</p>')
-            else:
-                new_lines.append(line)
+        return '\n'.join(out)
 
-        return '\n'.join(new_lines)
+    def _cache_key(self) -> str:
+        """Content hash of everything a rendered letter depends on."""
+        digest = hashlib.sha256(_generator_fingerprint().encode())
+        for part in (self.case_data, dict(self.firm_config), self._today_str):
+            digest.update(_canonical_json(part))
+        return digest.hexdigest()
 
     def save_outputs(self, output_dir: str) -> Dict[str, str]:
         """
@@ -932,16 +1151,41 @@ This firm represents **{plaintiff_name}** for injuries sustained in a motor vehi
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        # Generate content
-        markdown = self.generate_markdown()
-        html = self.generate_html()
-
-        # Save files
         md_path = output_path / "demand_letter.md"
         html_path = output_path / "demand_letter.html"
 
-        md_path.write_text(markdown)
-        html_path.write_text(html)
+        # Rendering is deterministic for a given case, config and letter date,
+        # so reuse a previous render of the same inputs when one is cached
+        self._ensure_loaded()
+        if not self._demand_calculated:
+            self.calculate_demand_amount()
+        self._date_letter()
+
+        cache_dir = output_path / CACHE_DIR_NAME
+        cache_key = self._cache_key()
+        cached_md = cache_dir / f"{cache_key}.md"
+        cached_html = cache_dir / f"{cache_key}.html"
+
+        if cached_md.exists() and cached_html.exists():
+            shutil.copyfile(cached_md, md_path)
+            shutil.copyfile(cached_html, html_path)
+        else:
+            markdown = self.generate_markdown()
+            html = self.generate_html(markdown)
+
+            # The directory holds one letter, so a new render replaces any
+            # stale one rather than accumulating a pair per day or edit
+            cache_dir.mkdir(exist_ok=True)
+            for stale in cache_dir.iterdir():
+                if CACHE_ENTRY_RE.fullmatch(stale.name) and stale.is_file():
+                    stale.unlink()
+
+            # Encode once and write the same raw bytes to the cache and the
+            # output; the HTML declares UTF-8 regardless of locale
+            for data, paths in ((markdown.encode('utf-8'), (cached_md, md_path)),
+                                (html.encode('utf-8'), (cached_html, html_path))):
+                for path in paths:
+                    path.write_bytes(data)
 
         return {
             'markdown': str(md_path),
@@ -950,6 +1194,65 @@ This firm represents **{plaintiff_name}** for injuries sustained in a motor vehi
         }
 
 
+def _case_name(case_summary_path: str) -> str:
+    """Name a case after its summary file, or its folder for a generic case_summary.json"""
+    path = Path(case_summary_path).resolve()
+    return path.parent.name if path.stem == "case_summary" else path.stem
+
+
+# Firm config shared by every letter in a batch, set once per worker process
+_batch_firm_config: Dict[str, Any] = {}
+
+
+def _init_batch_worker(firm_config: Dict[str, Any]) -> None:
+    """Install the batch's parsed firm config in a worker process."""
+    global _batch_firm_config
+    _batch_firm_config = firm_config
+
+
+def _render_one(job: Tuple[str, str]) -> Dict[str, Any]:
+    """Generate and save one demand letter (process pool worker)."""
+    case_summary_path, output_dir = job
+    generator = DemandLetterGenerator(case_summary_path)
+    generator.load_case_summary()
+    generator.load_firm_config(_batch_firm_config)
+    return generator.save_outputs(output_dir)
+
+
+def generate_batch(case_paths: List[str], config_path: Optional[str], output_dir: str,
+                   workers: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Generate demand letters for several case summaries in parallel worker processes.
+
+    Letters are saved under <output_dir>/<case name>/demand_letter.md and .html.
+
+    Args:
+        case_paths: Paths to case_summary.json files, one per case
+        config_path: Optional path to law_firm_config.json shared by all letters
+        output_dir: Directory to save the per-case letter folders in
+        workers: Number of worker processes (defaults to the CPU count)
+
+    Returns:
+        Dictionary mapping each case summary path to its save_outputs() result
+    """
+    outputs = [os.path.join(output_dir, _case_name(path)) for path in case_paths]
+    if len(set(outputs)) != len(outputs):
+        raise ValueError("Case summaries must have distinct case names")
+
+    # Parse the shared firm config once here rather than once per letter
+    firm_config = {}
+    if config_path and Path(config_path).exists():
+        firm_config = _load_json(Path(config_path))
+
+    workers = workers or os.cpu_count() or 1
+    jobs = list(zip(case_paths, outputs))
+    # Hand each worker several cases per round trip to amortize pickling
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                             initargs=(firm_config,)) as executor:
+        return dict(zip(case_paths, executor.map(_render_one, jobs, chunksize=chunksize)))
+
+
 def main():
     import argparse
 
@@ -958,7 +1261,7 @@ def main():
     )
     parser.add_argument(
         'case_summary',
-        help='Path to case_summary.json file'
+        help='Path to case_summary.json file, or a directory of case summary JSON files'
     )
     parser.add_argument(
         '--config', '-c',
@@ -970,9 +1273,26 @@ def main():
         help='Output directory',
         default='.'
     )
+    parser.add_argument(
+        '--workers', '-w',
+        help='Worker processes for a directory of case summaries (default: CPU count)',
+        type=int,
+        default=None
+    )
 
     args = parser.parse_args()
 
+    # Batch mode: one letter folder per case summary, rendered in parallel
+    if os.path.isdir(args.case_summary):
+        case_paths = sorted(str(path) for path in Path(args.case_summary).glob('*.json'))
+        batch_results = generate_batch(case_paths, args.config, args.output, args.workers)
+
+        print(f"Demand Letters Generated: {len(batch_results)}")
+        print(f"=========================")
+        for case_path, results in batch_results.items():
+            print(f"{case_path}: ${results['demand_amount']:,.2f} -> {results['markdown']}")
+        return
+
     # Generate demand letter
     generator = DemandLetterGenerator(args.case_summary, args.config)
     generator.load_case_summary()
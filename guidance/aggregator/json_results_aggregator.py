@@ -7,80 +7,235 @@ This version works with the structured JSON extraction (report.txt files).
 """
 
 import os
+import re
+import copy
 import json
+import math
+import hashlib
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional C-accelerated JSON parser and encoder
+    orjson = None
+
+try:
+    from result_cache import cached
+except ImportError:  # imported as part of the guidance.aggregator package
+    from .result_cache import cached
+
+# Worker threads used to overlap report reads and parses
+READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Words of a person's name, ignoring punctuation such as "Rodriguez, Maria"
+NAME_TOKEN_RE = re.compile(r"\w+")
+
+# Name words that say nothing about who a person is
+NAME_SUFFIXES = frozenset({"jr", "sr", "ii", "iii", "iv", "esq", "md"})
+
+# Single-pass body-part scan over a diagnosis, keyed by group name
+BODY_PART_RE = re.compile(
+    r'(?P<cervical>cervical)'
+    r'|(?P<lumbar>lumbar)'
+    r'|(?P<shoulder>shoulder|ac joint)',
+    re.IGNORECASE
+)
+BODY_PARTS = {
+    "cervical": "Cervical Spine (Neck)",
+    "lumbar": "Lumbar Spine (Lower Back)",
+    "shoulder": "Shoulder",
+}
+# Single-pass scan of diagnoses and imaging findings for serious injury indicators
+SERIOUS_INJURY_RE = re.compile(
+    r'(?P<radiculopathy>radiculopathy)'
+    r'|(?P<fracture>fracture)'
+    r'|(?P<disc>bulging|herniation)'
+    r'|(?P<tear>tear)',
+    re.IGNORECASE
+)
+
+
+def _load_json(path: str) -> Any:
+    """Parse a JSON file straight from its bytes"""
+    with open(path, 'rb') as f:
+        content = f.read()
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _number(value: Any, field: str) -> float:
+    """Return an amount as a number, parsing text such as "$1,250.00"
+
+    A missing or null amount counts as 0.0. So does text that is not a
+    number, with a warning, since it leaves the totals understated.
+    """
+    if isinstance(value, (int, float)):
+        return value
+    if value is None:
+        return 0.0
+    try:
+        amount = float(str(value).replace('$', '').replace(',', ''))
+    except ValueError:
+        amount = math.nan
+    if not math.isfinite(amount):
+        print(f"Warning: Could not parse {field} amount {value!r}, counting it as 0")
+        return 0.0
+    return amount
+
+
+def _name_key(name: str) -> Tuple[str, frozenset]:
+    """Surname and distinctive lowercase word tokens of a person's name
+
+    Initials and suffixes such as "Jr" are dropped. The surname is the last
+    remaining word, or the first for a "Surname, Given" name.
+    """
+    surname_first = "," in name
+    tokens = [token for token in NAME_TOKEN_RE.findall(name.lower())
+              if len(token) > 1 and token not in NAME_SUFFIXES]
+    if not tokens:
+        return "", frozenset()
+    return tokens[0] if surname_first else tokens[-1], frozenset(tokens)
+
+
+def _same_person(name: Tuple[str, frozenset], other: Tuple[str, frozenset]) -> bool:
+    """Whether two _name_key results share a surname or at least two name words"""
+    if not name[0] or not other[0]:
+        return False
+    return name[0] == other[0] or len(name[1] & other[1]) >= 2
+
+
+def _write_json(path: str, data: Any) -> None:
+    """Write data as indented JSON"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+
+def _json_bytes(data: Any) -> bytes:
+    """Serialize data as compact JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode()
+
+
+def _reports_key(reports: List[Tuple[str, str]]) -> str:
+    """Hash (document type, path) pairs with each file's size and modification time"""
+    digest = hashlib.sha256()
+    for doc_type, path in reports:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            continue
+        digest.update(f"{doc_type}\0{path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def _read_report(path: str) -> Any:
+    """Parse one report.txt (thread pool worker), returning expected errors instead of raising"""
+    try:
+        return _load_json(path)
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    except (FileNotFoundError, json.JSONDecodeError) as e:
+        return e
 
 
 class JSONResultsAggregator:
     """Aggregates structured JSON results from AWS IDP pipeline"""
 
-    def __init__(self, results_folder: str):
+    def __init__(self, results_folder: str, plaintiff_name: str = "",
+                 cache_dir: Optional[str] = None):
         self.results_folder = Path(results_folder)
+        # Optional folder for parsed documents, keyed by the report files'
+        # paths, sizes and modification times
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        # Name that marks a policy as the plaintiff's; when empty it is taken
+        # from the patient name in the medical records
+        self._plaintiff_name = _name_key(plaintiff_name)
         self.medical_records: List[Dict] = []
         self.police_reports: List[Dict] = []
         self.insurance_policies: List[Dict] = []
         self.medical_bills: List[Dict] = []
+        self._cache: Dict[str, Any] = {}
+        self._loaded = False
+
+        # Document type folder name -> document bucket
+        self._buckets: Dict[str, List[Dict]] = {
+            "MEDICAL_RECORDS": self.medical_records,
+            "POLICE_REPORT": self.police_reports,
+            "INSURANCE_POLICY": self.insurance_policies,
+            "MEDICAL_BILLS": self.medical_bills,
+        }
 
     def load_documents(self) -> None:
-        """Load all extracted JSON documents from AWS results"""
-        for hash_dir in self.results_folder.iterdir():
-            if not hash_dir.is_dir():
-                continue
-
-            for doc_type_dir in hash_dir.iterdir():
-                if not doc_type_dir.is_dir():
+        """Load all extracted JSON documents from AWS results, replacing any already loaded"""
+        self._cache.clear()
+        for bucket in self._buckets.values():
+            bucket.clear()
+        pending = []
+
+        with os.scandir(self.results_folder) as hash_dirs:
+            for hash_dir in hash_dirs:
+                if not hash_dir.is_dir():
                     continue
 
-                doc_type = doc_type_dir.name
-                report_file = doc_type_dir / "report.txt"
-
-                if report_file.exists():
-                    try:
-                        content = report_file.read_text()
-                        data = json.loads(content)
-
-                        if doc_type == "MEDICAL_RECORDS":
-                            self.medical_records.append(data)
-                        elif doc_type == "POLICE_REPORT":
-                            self.police_reports.append(data)
-                        elif doc_type == "INSURANCE_POLICY":
-                            self.insurance_policies.append(data)
-                        elif doc_type == "MEDICAL_BILLS":
-                            self.medical_bills.append(data)
-                    except json.JSONDecodeError as e:
-                        print(f"Warning: Could not parse JSON in {report_file}: {e}")
-
-    def extract_patient_info(self) -> Dict[str, Any]:
-        """Extract patient/plaintiff info from medical records"""
-        info = {"name": "", "dob": "", "address": "", "mrn": ""}
-
-        for record in self.medical_records:
-            # Patient info from medical record
-            if "patientName" in record:
-                info["name"] = record.get("patientName", "")
-                info["dob"] = record.get("dateOfBirth", "")
-                info["mrn"] = record.get("medicalRecordNumber", "")
-            elif "patient_info" in record:
-                patient = record["patient_info"]
-                info["name"] = patient.get("name", "")
-                info["dob"] = patient.get("date_of_birth", "")
-                info["mrn"] = patient.get("medical_record_number", "")
-
-        # Get address from police report
-        for report in self.police_reports:
-            drivers = report.get("drivers", [])
-            for driver in drivers:
-                if driver.get("vehicle_number") == 1:
-                    info["address"] = driver.get("address", "")
-                    break
-
-        return info
-
-    def extract_accident_info(self) -> Dict[str, Any]:
-        """Extract accident details from police report"""
-        info = {
+                with os.scandir(hash_dir.path) as doc_type_dirs:
+                    for doc_type_dir in doc_type_dirs:
+                        if doc_type_dir.name not in self._buckets or not doc_type_dir.is_dir():
+                            continue
+
+                        pending.append((doc_type_dir.name, os.path.join(doc_type_dir.path, "report.txt")))
+
+        self._loaded = True
+        if not pending:
+            return
+
+        cache_path = None
+        if self.cache_dir is not None:
+            cache_path = self.cache_dir / f"{_reports_key(pending)}.json"
+            try:
+                cached = _load_json(cache_path)
+            # Missing, or unreadable after an interrupted write
+            except (OSError, ValueError):
+                pass
+            else:
+                for doc_type, bucket in self._buckets.items():
+                    bucket.extend(cached.get(doc_type, []))
+                return
+
+        # Imported here so that importing the module for its report helpers
+        # does not load concurrent.futures and logging
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Parses are independent, so threads overlap their file reads
+        with ThreadPoolExecutor(max_workers=min(READ_WORKERS, len(pending))) as executor:
+            results = executor.map(_read_report, [path for _, path in pending])
+            parse_failed = False
+            for (doc_type, report_file), data in zip(pending, results):
+                if isinstance(data, FileNotFoundError):
+                    continue
+                if isinstance(data, json.JSONDecodeError):
+                    print(f"Warning: Could not parse JSON in {report_file}: {data}")
+                    parse_failed = True
+                    continue
+                self._buckets[doc_type].append(data)
+
+        # Leave folders with malformed reports uncached so the warnings repeat
+        if cache_path is not None and not parse_failed:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, 'wb') as f:
+                f.write(_json_bytes(self._buckets))
+
+    @cached
+    def _digest_police_reports(self) -> Dict[str, Any]:
+        """Read the plaintiff address and accident, defendant and liability details in one pass over the police reports"""
+        address = ""
+        accident_info = {
             "date": "",
             "time": "",
             "location": "",
@@ -89,77 +244,141 @@ class JSONResultsAggregator:
             "weather": "",
             "road_conditions": ""
         }
+        defendant = {
+            "name": "",
+            "vehicle": "",
+            "insurance": "",
+            "violations": [],
+            "contributing_factors": []
+        }
+        liability = {
+            "fault_determination": "",
+            "at_fault_party": "",
+            "contributing_factors": [],
+            "evidence": [],
+            "liability_percentage": {"plaintiff": 0, "defendant": 100}
+        }
 
         for report in self.police_reports:
+            # Plaintiff is the vehicle 1 driver; the at-fault driver is usually vehicle 2
+            plaintiff_found = defendant_found = False
+            for driver in report.get("drivers", []):
+                vehicle_number = driver.get("vehicle_number")
+                if vehicle_number == 1 and not plaintiff_found:
+                    address = driver.get("address", "")
+                    plaintiff_found = True
+                elif vehicle_number == 2 and not defendant_found:
+                    defendant["name"] = driver.get("name", "")
+                    defendant_found = True
+                if plaintiff_found and defendant_found:
+                    break
+
+            # Accident details
             report_info = report.get("report_info", {})
-            info["report_number"] = report_info.get("report_number", "")
-            info["date"] = report_info.get("date_prepared", "")
+            accident_info["report_number"] = report_info.get("report_number", "")
 
             accident = report.get("accident_details", {})
-            info["date"] = accident.get("date", info["date"])
-            info["time"] = accident.get("time", "")
-            info["weather"] = accident.get("weather_conditions", "")
-            info["road_conditions"] = accident.get("road_conditions", "")
+            accident_info["date"] = accident.get("date", report_info.get("date_prepared", ""))
+            accident_info["time"] = accident.get("time", "")
+            accident_info["weather"] = accident.get("weather_conditions", "")
+            accident_info["road_conditions"] = accident.get("road_conditions", "")
 
             location = accident.get("location", {})
             if isinstance(location, dict):
                 cross = location.get("cross_street", "")
                 borough = location.get("borough", "")
                 county = location.get("county", "")
-                info["location"] = f"{cross}, {borough}, {county}".strip(", ")
+                accident_info["location"] = f"{cross}, {borough}, {county}".strip(", ")
             else:
-                info["location"] = str(location)
-
-            info["description"] = report.get("narrative", "")
-
-        return info
-
-    def extract_defendant_info(self) -> Dict[str, Any]:
-        """Extract defendant/at-fault party info"""
-        info = {
-            "name": "",
-            "vehicle": "",
-            "insurance": "",
-            "violations": [],
-            "contributing_factors": []
-        }
+                accident_info["location"] = str(location)
 
-        for report in self.police_reports:
-            # Find at-fault driver (usually vehicle 2)
-            drivers = report.get("drivers", [])
-            for driver in drivers:
-                if driver.get("vehicle_number") == 2:
-                    info["name"] = driver.get("name", "")
-                    break
+            narrative = report.get("narrative", "")
+            accident_info["description"] = narrative
 
-            # Get vehicle info
-            vehicles = report.get("vehicles", [])
-            for vehicle in vehicles:
+            # Defendant vehicle info
+            for vehicle in report.get("vehicles", []):
                 if vehicle.get("vehicle_number") == 2:
                     year = vehicle.get("year", "")
                     make = vehicle.get("make", "")
                     model = vehicle.get("model", "")
-                    info["vehicle"] = f"{year} {make} {model}".strip()
+                    defendant["vehicle"] = f"{year} {make} {model}".strip()
 
                     insurance = vehicle.get("insurance", {})
                     company = insurance.get("company", "")
                     policy = insurance.get("policy_number", "")
-                    info["insurance"] = f"{company} Policy #{policy}".strip()
+                    defendant["insurance"] = f"{company} Policy #{policy}".strip()
                     break
 
-            # Get violations
+            # Violations and fault
             fault = report.get("fault_indicators", {})
-            violations = fault.get("violations_cited", [])
-            for v in violations:
+            for v in fault.get("violations_cited", []):
                 vtl = v.get("vtl_section", "")
                 desc = v.get("description", "")
                 if vtl or desc:
-                    info["violations"].append(f"VTL {vtl} - {desc}".strip(" -"))
+                    defendant["violations"].append(f"VTL {vtl} - {desc}".strip(" -"))
+
+            defendant["contributing_factors"] = fault.get("contributing_factors", [])
+            liability["fault_determination"] = fault.get("fault_determination", "")
+            liability["at_fault_party"] = fault.get("apparent_fault", "")
+            liability["contributing_factors"] = fault.get("contributing_factors", [])
+
+            # Evidence
+            if report.get("diagram_present"):
+                liability["evidence"].append("Accident diagram")
+            if report.get("photos_taken"):
+                liability["evidence"].append("Photos taken at scene")
 
-            info["contributing_factors"] = fault.get("contributing_factors", [])
+            # Witnesses
+            witnesses = report.get("witnesses", [])
+            if witnesses:
+                liability["evidence"].append(f"{len(witnesses)} witness statement(s)")
+
+            # Check narrative for evidence mentions
+            narrative = narrative.lower()
+            if "traffic camera" in narrative or "camera footage" in narrative:
+                liability["evidence"].append("Traffic camera footage")
+
+        return {
+            "address": address,
+            "accident": accident_info,
+            "defendant": defendant,
+            "liability": liability,
+        }
+
+    @cached
+    def extract_patient_info(self) -> Dict[str, Any]:
+        """Extract patient/plaintiff info from medical records"""
+        info = {"name": "", "dob": "", "address": "", "mrn": ""}
+
+        # The last record with patient details wins, so search from the end
+        for record in reversed(self.medical_records):
+            # Patient info from medical record
+            if "patientName" in record:
+                info["name"] = record.get("patientName", "")
+                info["dob"] = record.get("dateOfBirth", "")
+                info["mrn"] = record.get("medicalRecordNumber", "")
+                break
+            if "patient_info" in record:
+                patient = record["patient_info"]
+                info["name"] = patient.get("name", "")
+                info["dob"] = patient.get("date_of_birth", "")
+                info["mrn"] = patient.get("medical_record_number", "")
+                break
+
+        # Get address from police report
+        info["address"] = self._digest_police_reports()["address"]
 
         return info
 
+    def extract_accident_info(self) -> Dict[str, Any]:
+        """Extract accident details from police report"""
+        return self._digest_police_reports()["accident"]
+
+    def extract_defendant_info(self) -> Dict[str, Any]:
+        """Extract defendant/at-fault party info"""
+        return self._digest_police_reports()["defendant"]
+
+    @cached
     def extract_injuries(self) -> Dict[str, Any]:
         """Extract injury information from medical records"""
         injuries = {
@@ -171,6 +390,10 @@ class JSONResultsAggregator:
             "prognosis": "",
             "imaging_findings": []
         }
+        # Insertion-ordered sets, converted to lists once all records are read
+        diagnoses: Dict[str, None] = {}
+        icd_codes: Dict[str, None] = {}
+        body_parts: Dict[str, None] = {}
 
         for record in self.medical_records:
             # Handle different JSON structures
@@ -180,22 +403,18 @@ class JSONResultsAggregator:
                     diag_text = diagnosis.get("diagnosis", "")
                     icd = diagnosis.get("icd10Code", "")
                     if diag_text:
-                        injuries["diagnoses"].append(diag_text)
+                        diagnoses[diag_text] = None
                     if icd:
-                        injuries["icd_codes"].append(icd)
+                        icd_codes[icd] = None
 
                 injuries["treatment_plan"] = record.get("plan", [])
                 injuries["prognosis"] = record.get("prognosis", "")
 
                 # Extract body parts from diagnoses
-                for diag in injuries["diagnoses"]:
-                    diag_lower = diag.lower()
-                    if "cervical" in diag_lower:
-                        injuries["body_parts"].append("Cervical Spine (Neck)")
-                    if "lumbar" in diag_lower:
-                        injuries["body_parts"].append("Lumbar Spine (Lower Back)")
-                    if "shoulder" in diag_lower or "ac joint" in diag_lower:
-                        injuries["body_parts"].append("Shoulder")
+                for diag in diagnoses:
+                    body_parts.update(
+                        (BODY_PARTS[match.lastgroup], None) for match in BODY_PART_RE.finditer(diag)
+                    )
 
                 # Imaging findings
                 imaging = record.get("diagnosticImaging", {})
@@ -207,11 +426,11 @@ class JSONResultsAggregator:
                 # Alternative format
                 for diag in record.get("diagnoses", []):
                     if isinstance(diag, dict):
-                        injuries["diagnoses"].append(diag.get("description", ""))
+                        diagnoses[diag.get("description", "")] = None
                         if diag.get("icd_code"):
-                            injuries["icd_codes"].append(diag["icd_code"])
+                            icd_codes[diag["icd_code"]] = None
                         if diag.get("body_part"):
-                            injuries["body_parts"].append(diag["body_part"])
+                            body_parts[diag["body_part"]] = None
 
             # Work restrictions
             func = record.get("functional_limitations", {})
@@ -225,13 +444,13 @@ class JSONResultsAggregator:
                 if "no work" in item.lower():
                     injuries["work_restrictions"] = item
 
-        # Deduplicate
-        injuries["icd_codes"] = list(set(injuries["icd_codes"]))
-        injuries["body_parts"] = list(set(injuries["body_parts"]))
-        injuries["diagnoses"] = list(dict.fromkeys(injuries["diagnoses"]))
+        injuries["diagnoses"] = list(diagnoses)
+        injuries["icd_codes"] = list(icd_codes)
+        injuries["body_parts"] = list(body_parts)
 
         return injuries
 
+    @cached
     def extract_medical_bills(self) -> Dict[str, Any]:
         """Extract billing information"""
         bills = {
@@ -244,32 +463,36 @@ class JSONResultsAggregator:
             "cpt_codes": [],
             "line_items": []
         }
+        # Insertion-ordered sets, converted to lists once all bills are read
+        providers: Dict[str, None] = {}
+        cpt_codes: Dict[str, None] = {}
 
         for bill in self.medical_bills:
             # Provider info
             provider = bill.get("billing_provider", {})
             provider_name = provider.get("name", "")
-            if provider_name and provider_name not in bills["providers"]:
-                bills["providers"].append(provider_name)
+            if provider_name:
+                providers[provider_name] = None
 
             # Billing summary
             summary = bill.get("billing_summary", {})
-            bills["total_charges"] += summary.get("total_charges", 0.0)
-            bills["total_paid"] += summary.get("total_payments", 0.0)
-            bills["total_owed"] += summary.get("balance_due", 0.0)
-            bills["total_adjustments"] += summary.get("total_adjustments", 0.0)
+            bills["total_charges"] += _number(summary.get("total_charges"), "total_charges")
+            bills["total_paid"] += _number(summary.get("total_payments"), "total_payments")
+            bills["total_owed"] += _number(summary.get("balance_due"), "balance_due")
+            bills["total_adjustments"] += _number(summary.get("total_adjustments"), "total_adjustments")
 
             # Line items with CPT codes
-            for item in bill.get("line_items", []):
-                cpt = item.get("cpt_code", "")
-                if cpt:
-                    bills["cpt_codes"].append(cpt)
-                bills["line_items"].append({
+            line_items = [
+                {
                     "date": item.get("date_of_service", ""),
-                    "cpt": cpt,
+                    "cpt": item.get("cpt_code", ""),
                     "description": item.get("description", ""),
                     "charge": item.get("total_charge", 0.0)
-                })
+                }
+                for item in bill.get("line_items", [])
+            ]
+            bills["line_items"].extend(line_items)
+            cpt_codes.update((item["cpt"], None) for item in line_items if item["cpt"])
 
             # Liens
             lien_info = bill.get("lien_info", {})
@@ -285,9 +508,11 @@ class JSONResultsAggregator:
                     "amount": bills["total_owed"]
                 })
 
-        bills["cpt_codes"] = list(set(bills["cpt_codes"]))
+        bills["providers"] = list(providers)
+        bills["cpt_codes"] = list(cpt_codes)
         return bills
 
+    @cached
     def extract_insurance_coverage(self) -> Dict[str, Any]:
         """Extract insurance coverage information"""
         coverage = {
@@ -300,6 +525,10 @@ class JSONResultsAggregator:
             "meets_ny_minimum": False
         }
 
+        plaintiff_name = self._plaintiff_name
+        if not plaintiff_name[0]:
+            plaintiff_name = _name_key(self.extract_patient_info()["name"])
+
         for policy in self.insurance_policies:
             policy_info = policy.get("policy_info", {})
             named_insured = policy.get("named_insured", {})
@@ -341,8 +570,7 @@ class JSONResultsAggregator:
             }
 
             # Determine if plaintiff or defendant policy
-            insured_name = named_insured.get("name", "").lower()
-            if "rodriguez" in insured_name or "maria" in insured_name:
+            if _same_person(_name_key(named_insured.get("name", "")), plaintiff_name):
                 coverage["plaintiff_policy"] = policy_data
                 coverage["pip_available"] = pip_total
                 coverage["sum_available"] = sum_per_person
@@ -364,39 +592,9 @@ class JSONResultsAggregator:
 
     def analyze_liability(self) -> Dict[str, Any]:
         """Analyze liability based on police report"""
-        liability = {
-            "fault_determination": "",
-            "at_fault_party": "",
-            "contributing_factors": [],
-            "evidence": [],
-            "liability_percentage": {"plaintiff": 0, "defendant": 100}
-        }
-
-        for report in self.police_reports:
-            fault = report.get("fault_indicators", {})
-
-            liability["fault_determination"] = fault.get("fault_determination", "")
-            liability["at_fault_party"] = fault.get("apparent_fault", "")
-            liability["contributing_factors"] = fault.get("contributing_factors", [])
-
-            # Evidence
-            if report.get("diagram_present"):
-                liability["evidence"].append("Accident diagram")
-            if report.get("photos_taken"):
-                liability["evidence"].append("Photos taken at scene")
-
-            # Witnesses
-            witnesses = report.get("witnesses", [])
-            if witnesses:
-                liability["evidence"].append(f"{len(witnesses)} witness statement(s)")
-
-            # Check narrative for evidence mentions
-            narrative = report.get("narrative", "").lower()
-            if "traffic camera" in narrative or "camera footage" in narrative:
-                liability["evidence"].append("Traffic camera footage")
-
-        return liability
+        return self._digest_police_reports()["liability"]
 
+    @cached
     def analyze_ny_serious_injury(self) -> Dict[str, Any]:
         """Analyze NY Insurance Law 5102(d) serious injury threshold"""
         analysis = {
@@ -415,21 +613,21 @@ class JSONResultsAggregator:
 
         # Check diagnoses for serious injury indicators
         for diag in injuries["diagnoses"]:
-            diag_lower = diag.lower()
-            if "radiculopathy" in diag_lower:
+            found = {match.lastgroup for match in SERIOUS_INJURY_RE.finditer(diag)}
+            if "radiculopathy" in found:
                 analysis["threshold_categories"].append("Significant limitation of use of body function/system")
                 analysis["supporting_evidence"].append("Radiculopathy diagnosis")
-            if "fracture" in diag_lower:
+            if "fracture" in found:
                 analysis["threshold_categories"].append("Fracture")
                 analysis["supporting_evidence"].append(f"Fracture: {diag}")
 
         # Check imaging for structural damage
         for finding in injuries["imaging_findings"]:
-            finding_lower = finding.lower()
-            if "bulging" in finding_lower or "herniation" in finding_lower:
+            found = {match.lastgroup for match in SERIOUS_INJURY_RE.finditer(finding)}
+            if "disc" in found:
                 analysis["threshold_categories"].append("Permanent consequential limitation")
                 analysis["supporting_evidence"].append(f"Disc pathology: {finding}")
-            if "tear" in finding_lower:
+            if "tear" in found:
                 analysis["supporting_evidence"].append(f"Soft tissue damage: {finding}")
 
         # Check prognosis
@@ -438,7 +636,7 @@ class JSONResultsAggregator:
                 analysis["supporting_evidence"].append(f"Prognosis: {injuries['prognosis']}")
 
         # Deduplicate
-        analysis["threshold_categories"] = list(set(analysis["threshold_categories"]))
+        analysis["threshold_categories"] = list(dict.fromkeys(analysis["threshold_categories"]))
         analysis["meets_threshold"] = len(analysis["threshold_categories"]) > 0
 
         if analysis["meets_threshold"]:
@@ -448,6 +646,7 @@ class JSONResultsAggregator:
 
         return analysis
 
+    @cached
     def calculate_damages(self) -> Dict[str, Any]:
         """Calculate special damages"""
         bills = self.extract_medical_bills()
@@ -477,10 +676,13 @@ class JSONResultsAggregator:
         bills = self.extract_medical_bills()
         coverage = self.extract_insurance_coverage()
 
-        # Based on treatment plan
+        # Based on treatment plan; seen_tokens holds the keywords already
+        # turned into an action
+        seen_tokens = set()
         for item in injuries["treatment_plan"]:
             item_lower = item.lower()
-            if "mri" in item_lower and "mri" not in " ".join(actions).lower():
+            if "mri" in item_lower and "mri" not in seen_tokens:
+                seen_tokens.add("mri")
                 actions.append("Schedule MRI as recommended in treatment plan")
             if "follow up" in item_lower and "orthopedic" in item_lower:
                 actions.append("Schedule orthopedic follow-up appointment")
@@ -509,13 +711,26 @@ class JSONResultsAggregator:
 
         return actions
 
-    def generate_summary(self) -> Dict[str, Any]:
-        """Generate complete case summary"""
-        self.load_documents()
+    def generate_summary(self, generated_at: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Generate complete case summary
+
+        Documents are loaded on the first call; call load_documents() to pick
+        up changes to the results folder. Pass generated_at to pin the
+        timestamp, e.g. one shared time for a batch, so that equal inputs
+        give identical summaries.
+
+        The extractors return their cached results, shared between calls;
+        the summary holds deep copies, so editing it leaves them intact.
+        """
+        if not self._loaded:
+            self.load_documents()
+        if generated_at is None:
+            generated_at = datetime.now()
 
         summary = {
             "case_id": self.results_folder.name,
-            "generated_date": datetime.now().isoformat(),
+            "generated_date": generated_at.isoformat(),
             "extraction_type": "structured_json",
             "document_counts": {
                 "medical_records": len(self.medical_records),
@@ -535,11 +750,12 @@ class JSONResultsAggregator:
             "recommended_actions": self.generate_recommended_actions()
         }
 
-        return summary
+        return copy.deepcopy(summary)
 
     def generate_markdown_report(self, summary: Dict[str, Any]) -> str:
         """Generate a formatted markdown report"""
-        report = f"""# NY Personal Injury Case Summary
+        parts: List[str] = []
+        parts.append(f"""# NY Personal Injury Case Summary
 ## Case ID: {summary['case_id']}
 Generated: {summary['generated_date']}
 Extraction Type: {summary.get('extraction_type', 'structured_json')}
@@ -566,13 +782,12 @@ Extraction Type: {summary.get('extraction_type', 'structured_json')}
 - **Name:** {summary['defendant']['name']}
 - **Vehicle:** {summary['defendant']['vehicle']}
 - **Insurance:** {summary['defendant']['insurance']}
-"""
+""")
         if summary['defendant']['violations']:
-            report += "- **Violations Issued:**\n"
-            for v in summary['defendant']['violations']:
-                report += f"  - {v}\n"
+            parts.append("- **Violations Issued:**\n")
+            parts.extend(f"  - {v}\n" for v in summary['defendant']['violations'])
 
-        report += f"""
+        parts.append(f"""
 ## Accident Details
 - **Date:** {summary['accident']['date']}
 - **Time:** {summary['accident']['time']}
@@ -587,24 +802,20 @@ Extraction Type: {summary.get('extraction_type', 'structured_json')}
 ## Injuries & Diagnoses
 
 ### Body Parts Affected
-"""
-        for bp in summary['injuries']['body_parts']:
-            report += f"- {bp}\n"
+""")
+        parts.extend(f"- {bp}\n" for bp in summary['injuries']['body_parts'])
 
-        report += "\n### Diagnoses\n"
-        for d in summary['injuries']['diagnoses']:
-            report += f"- {d}\n"
+        parts.append("\n### Diagnoses\n")
+        parts.extend(f"- {d}\n" for d in summary['injuries']['diagnoses'])
 
-        report += "\n### ICD-10 Codes\n"
-        for code in summary['injuries']['icd_codes']:
-            report += f"- `{code}`\n"
+        parts.append("\n### ICD-10 Codes\n")
+        parts.extend(f"- `{code}`\n" for code in summary['injuries']['icd_codes'])
 
         if summary['injuries']['imaging_findings']:
-            report += "\n### Imaging Findings\n"
-            for finding in summary['injuries']['imaging_findings']:
-                report += f"- {finding}\n"
+            parts.append("\n### Imaging Findings\n")
+            parts.extend(f"- {finding}\n" for finding in summary['injuries']['imaging_findings'])
 
-        report += f"""
+        parts.append(f"""
 ### Work Restrictions
 {summary['injuries']['work_restrictions'] or 'None documented'}
 
@@ -623,24 +834,22 @@ Extraction Type: {summary.get('extraction_type', 'structured_json')}
 | Outstanding Balance | ${summary['medical_bills']['total_owed']:,.2f} |
 
 ### Providers
-"""
-        for provider in summary['medical_bills']['providers']:
-            report += f"- {provider}\n"
+""")
+        parts.extend(f"- {provider}\n" for provider in summary['medical_bills']['providers'])
 
         if summary['medical_bills']['liens']:
-            report += "\n### Medical Liens\n"
-            for lien in summary['medical_bills']['liens']:
-                report += f"- {lien['provider']}: ${lien['amount']:,.2f}\n"
+            parts.append("\n### Medical Liens\n")
+            parts.extend(f"- {lien['provider']}: ${lien['amount']:,.2f}\n" for lien in summary['medical_bills']['liens'])
 
         if summary['medical_bills']['cpt_codes']:
-            report += "\n### CPT Codes\n"
-            report += ", ".join([f"`{code}`" for code in summary['medical_bills']['cpt_codes'][:10]])
+            parts.append("\n### CPT Codes\n")
+            parts.append(", ".join([f"`{code}`" for code in summary['medical_bills']['cpt_codes'][:10]]))
             if len(summary['medical_bills']['cpt_codes']) > 10:
-                report += f" (+{len(summary['medical_bills']['cpt_codes']) - 10} more)"
-            report += "\n"
+                parts.append(f" (+{len(summary['medical_bills']['cpt_codes']) - 10} more)")
+            parts.append("\n")
 
         pp = summary['insurance_coverage'].get('plaintiff_policy', {})
-        report += f"""
+        parts.append(f"""
 ---
 
 ## Insurance Coverage
@@ -666,16 +875,14 @@ Extraction Type: {summary.get('extraction_type', 'structured_json')}
 **Fault Determination:** {summary['liability_analysis']['fault_determination']}
 
 ### Contributing Factors
-"""
-        for f in summary['liability_analysis']['contributing_factors']:
-            report += f"- {f}\n"
+""")
+        parts.extend(f"- {f}\n" for f in summary['liability_analysis']['contributing_factors'])
 
-        report += "\n### Evidence\n"
-        for e in summary['liability_analysis']['evidence']:
-            report += f"- {e}\n"
+        parts.append("\n### Evidence\n")
+        parts.extend(f"- {e}\n" for e in summary['liability_analysis']['evidence'])
 
         ny = summary['ny_serious_injury_analysis']
-        report += f"""
+        parts.append(f"""
 ---
 
 ## NY Serious Injury Analysis (Insurance Law 5102(d))
@@ -683,44 +890,41 @@ Extraction Type: {summary.get('extraction_type', 'structured_json')}
 **Meets Threshold:** {'✅ YES' if ny['meets_threshold'] else '⚠️ NEEDS REVIEW'}
 
 ### Threshold Categories Met
-"""
+""")
         if ny['threshold_categories']:
-            for cat in ny['threshold_categories']:
-                report += f"- {cat}\n"
+            parts.extend(f"- {cat}\n" for cat in ny['threshold_categories'])
         else:
-            report += "- None identified\n"
+            parts.append("- None identified\n")
 
-        report += "\n### Supporting Evidence\n"
-        for ev in ny['supporting_evidence']:
-            report += f"- {ev}\n"
+        parts.append("\n### Supporting Evidence\n")
+        parts.extend(f"- {ev}\n" for ev in ny['supporting_evidence'])
 
-        report += f"\n**Notes:** {ny['notes']}\n"
+        parts.append(f"\n**Notes:** {ny['notes']}\n")
 
-        report += """
+        parts.append("""
 ---
 
 ## Recommended Actions
-"""
-        for i, action in enumerate(summary['recommended_actions'], 1):
-            report += f"{i}. {action}\n"
+""")
+        parts.extend(f"{i}. {action}\n" for i, action in enumerate(summary['recommended_actions'], 1))
 
-        report += """
+        parts.append("""
 ---
 
 ## Case Value Summary
 
 | Category | Amount |
 |----------|--------|
-"""
-        report += f"| Total Medical Specials | ${summary['special_damages']['medical_expenses']['total_billed']:,.2f} |\n"
-        report += f"| Outstanding Medical Bills | ${summary['special_damages']['medical_expenses']['outstanding']:,.2f} |\n"
-        report += f"| Available Coverage | ${summary['insurance_coverage']['total_available_coverage']:,.2f} |\n"
+""")
+        parts.append(f"| Total Medical Specials | ${summary['special_damages']['medical_expenses']['total_billed']:,.2f} |\n")
+        parts.append(f"| Outstanding Medical Bills | ${summary['special_damages']['medical_expenses']['outstanding']:,.2f} |\n")
+        parts.append(f"| Available Coverage | ${summary['insurance_coverage']['total_available_coverage']:,.2f} |\n")
 
-        report += """
+        parts.append("""
 ---
 *This summary was automatically generated from structured JSON extraction via AWS IDP pipeline.*
-"""
-        return report
+""")
+        return "".join(parts)
 
 
 def main():
@@ -728,15 +932,19 @@ def main():
     parser = argparse.ArgumentParser(description='Aggregate structured JSON results for PI case')
     parser.add_argument('results_folder', help='Path to AWS results folder')
     parser.add_argument('--output', '-o', help='Output file path', default='case_summary_json')
+    parser.add_argument('--plaintiff-name', default='',
+                        help='Plaintiff name used to identify their insurance policy '
+                             '(defaults to the patient name in the medical records)')
+    parser.add_argument('--cache-dir',
+                        help='Folder for parsed documents, reused while the report files are unchanged')
     args = parser.parse_args()
 
-    aggregator = JSONResultsAggregator(args.results_folder)
+    aggregator = JSONResultsAggregator(args.results_folder, args.plaintiff_name, args.cache_dir)
     summary = aggregator.generate_summary()
 
     # Save JSON
     json_path = f"{args.output}.json"
-    with open(json_path, 'w') as f:
-        json.dump(summary, f, indent=2)
+    _write_json(json_path, summary)
     print(f"✓ JSON summary saved to: {json_path}")
 
     # Save Markdown
@@ -12,15 +12,194 @@ Example:
     python pi_case_aggregator.py ./sample_files/pi_case_001/output --output case_summary.json
 """
 
+import html
 import json
 import os
 import sys
 import argparse
+import codecs
+import copy
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
-from collections import defaultdict
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, TextIO, Tuple
+from dataclasses import dataclass, asdict, is_dataclass
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # optional C-accelerated JSON parser and encoder
+    orjson = None
+
+try:
+    from result_cache import cached
+except ImportError:  # imported as part of the guidance.aggregator package
+    from .result_cache import cached
+
+# Worker threads used to overlap document reads and parses
+READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Extracted document type folders under a case folder
+DOCUMENT_TYPES = ("MEDICAL_RECORDS", "POLICE_REPORT", "INSURANCE_POLICY", "MEDICAL_BILLS")
+
+# Shared read-only default for missing document sections
+EMPTY_SECTION: Mapping[str, Any] = MappingProxyType({})
+
+# Bill treatment_summary key -> category label, filled as keys are first seen
+CATEGORY_LABELS: Dict[str, str] = {}
+
+# NY Insurance Law 5102(d) serious injury categories as bit flags
+PERMANENT_CONSEQUENTIAL_LIMITATION = 1 << 0
+SIGNIFICANT_LIMITATION_OF_USE = 1 << 1
+PERMANENT_LOSS_OF_USE = 1 << 2
+FRACTURE = 1 << 3
+SIGNIFICANT_DISFIGUREMENT = 1 << 4
+NINETY_ONE_EIGHTY_DISABILITY = 1 << 5
+PERMANENT_CATEGORIES = PERMANENT_CONSEQUENTIAL_LIMITATION | PERMANENT_LOSS_OF_USE
+
+# (record indicator key, category flag, category name), in report order
+SERIOUS_INJURY_CATEGORIES = (
+    ("permanent_consequential_limitation", PERMANENT_CONSEQUENTIAL_LIMITATION, "Permanent Consequential Limitation"),
+    ("significant_limitation_of_use", SIGNIFICANT_LIMITATION_OF_USE, "Significant Limitation of Use"),
+    ("permanent_loss_of_use", PERMANENT_LOSS_OF_USE, "Permanent Loss of Use"),
+    ("fracture", FRACTURE, "Fracture"),
+    ("significant_disfigurement", SIGNIFICANT_DISFIGUREMENT, "Significant Disfigurement"),
+    ("ninety_one_eighty_disability", NINETY_ONE_EIGHTY_DISABILITY, "90/180 Day Disability"),
+)
+
+# Markdown report layout, filled from a flat dict of prepared fields. Repeated
+# rows are pre-joined, each starting with a newline so it follows its header.
+MARKDOWN_REPORT_TEMPLATE = """# Case Summary: {case_id}
+*Generated: {generated_date}*
+
+## Plaintiff Information
+- **Name:** {plaintiff_name}
+- **DOB:** {plaintiff_dob}
+- **Age at Accident:** {plaintiff_age}
+- **Address:** {plaintiff_address}
+
+## Defendant Information
+- **Driver:** {defendant_driver}
+- **Employer:** {defendant_employer}
+- **Vehicle:** {vehicle_year} {vehicle_make} {vehicle_model}
+- **Insurance:** {insurance_company} - Limits: ${bi_per_person:,}/{bi_per_accident:,}
+
+## Accident Details
+- **Date:** {accident_date} at {accident_time}
+- **Location:** {accident_location}, {accident_borough}
+- **Report #:** {police_report_number}
+- **Description:** {accident_description}...
+
+## Injuries
+### Primary Diagnoses{primary_diagnoses}
+
+**Body Parts Affected:** {body_parts}
+
+## Special Damages
+| Category | Amount |
+|----------|--------|
+| Total Medical Charges | ${total_medical_charges:,.2f} |
+| Paid by No-Fault | ${total_paid_by_no_fault:,.2f} |
+| Adjustments | ${total_adjustments:,.2f} |
+| Outstanding Balance | ${total_outstanding_balance:,.2f} |
+| Total Liens | ${total_liens:,.2f} |
+| No-Fault Remaining | ${no_fault_remaining:,.2f} |
+
+## NY Serious Injury Analysis
+**Meets Threshold:** {meets_threshold}
+**Categories Met:** {categories_met}
+**Strength:** {strength_assessment}
+
+### Supporting Evidence{supporting_evidence}
+
+## Liability Analysis
+**Fault Determination:** {fault_determination}
+**Comparative Fault Risk:** {comparative_fault_risk}
+**Assessment:** {liability_assessment}
+
+## Case Value Assessment
+**Special Damages:** ${special_damages_total:,.2f}
+
+**Estimated Value Range:**
+- Low: ${value_low:,.2f}
+- Mid: ${value_mid:,.2f}
+- High: ${value_high:,.2f}
+
+**Positive Factors:**{positive_factors}{negative_factors}
+
+## Recommended Actions{recommended_actions}"""
+
+# Page shell for the HTML report; %s placeholders are the case id and the
+# escaped markdown. Plain %-formatting keeps the CSS braces unescaped (a
+# literal percent is written %%).
+HTML_REPORT_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+    <title>Case Summary - %s</title>
+    <style>
+        body { font-family: Arial, sans-serif; max-width: 900px; margin: 0 auto; padding: 20px; }
+        h1 { color: #2c3e50; border-bottom: 2px solid #3498db; }
+        h2 { color: #34495e; margin-top: 30px; }
+        table { border-collapse: collapse; width: 100%%; margin: 15px 0; }
+        th, td { border: 1px solid #ddd; padding: 10px; text-align: left; }
+        th { background-color: #3498db; color: white; }
+        .urgent { color: #e74c3c; font-weight: bold; }
+        .positive { color: #27ae60; }
+        .negative { color: #e74c3c; }
+        pre { background: #f4f4f4; padding: 15px; overflow-x: auto; }
+    </style>
+</head>
+<body>
+<pre>%s</pre>
+</body>
+</html>"""
+
+
+def _read_json(path: str) -> Any:
+    """Load one extracted JSON document (thread pool worker)"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path) as f:
+        return json.load(f)
+
+
+def _provider_key(name: str) -> str:
+    """Dedupe key for a provider name, ignoring case and surrounding whitespace"""
+    return name.strip().casefold()
+
+
+def _iter_json(folder: str) -> List[str]:
+    """List the .json files directly inside a document type folder"""
+    with os.scandir(folder) as entries:
+        return [entry.path for entry in entries if entry.name.endswith(".json") and entry.is_file()]
+
+
+def _dumps_json(data: Any) -> str:
+    """Serialize data (or a dataclass) as indented JSON"""
+    if orjson is not None:
+        # orjson walks dataclass fields itself, so no asdict() deep copy is needed
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2).decode()
+    if is_dataclass(data):
+        data = asdict(data)
+    return json.dumps(data, indent=2, ensure_ascii=False, default=str)
+
+
+def _dump_json(data: Any, fp: TextIO) -> None:
+    """Write data (or a dataclass) as indented JSON to an open text file"""
+    if orjson is not None:
+        buffer = getattr(fp, "buffer", None)
+        if buffer is not None and codecs.lookup(fp.encoding).name == "utf-8":
+            # orjson already produces UTF-8, so skip the decode and re-encode
+            fp.flush()
+            buffer.write(orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2))
+            return
+        fp.write(_dumps_json(data))
+        return
+    if is_dataclass(data):
+        data = asdict(data)
+    # json.dump writes the encoder's chunks as they are produced
+    json.dump(data, fp, indent=2, ensure_ascii=False, default=str)
 
 
 @dataclass
@@ -47,42 +226,74 @@ class PICaseAggregator:
 
     def __init__(self, case_folder: str):
         self.case_folder = Path(case_folder)
-        self.medical_records: List[Dict] = []
-        self.police_reports: List[Dict] = []
-        self.insurance_policies: List[Dict] = []
-        self.medical_bills: List[Dict] = []
+        self._cache: Dict[str, Any] = {}
+        self._loaded = False
+
+        # Document type folder name -> documents, filled on first access or by load_documents
+        self._buckets: Dict[str, List[Dict]] = {}
+
+    @property
+    def medical_records(self) -> List[Dict]:
+        return self._bucket("MEDICAL_RECORDS")
+
+    @property
+    def police_reports(self) -> List[Dict]:
+        return self._bucket("POLICE_REPORT")
+
+    @property
+    def insurance_policies(self) -> List[Dict]:
+        return self._bucket("INSURANCE_POLICY")
+
+    @property
+    def medical_bills(self) -> List[Dict]:
+        return self._bucket("MEDICAL_BILLS")
+
+    def _bucket(self, doc_type: str) -> List[Dict]:
+        """Documents of one type, read from the case folder the first time they are needed"""
+        if doc_type not in self._buckets:
+            self._buckets.update(self._read_documents((doc_type,)))
+        return self._buckets[doc_type]
+
+    def _read_documents(self, doc_types: Tuple[str, ...]) -> Dict[str, List[Dict]]:
+        """Read and parse the JSON documents of the given types, in folder order"""
+        buckets: Dict[str, List[Dict]] = {doc_type: [] for doc_type in doc_types}
+        pending = []
+        for doc_type in doc_types:
+            doc_path = os.path.join(self.case_folder, doc_type)
+            if os.path.isdir(doc_path):
+                pending.extend((buckets[doc_type], file) for file in _iter_json(doc_path))
+
+        if not pending:
+            return buckets
+
+        # Reads and parses are independent, so threads overlap their latency
+        with ThreadPoolExecutor(max_workers=min(READ_WORKERS, len(pending))) as executor:
+            documents = executor.map(_read_json, [file for _, file in pending])
+            for (bucket, _), document in zip(pending, documents):
+                bucket.append(document)
+        return buckets
 
     def load_documents(self) -> None:
         """Load all extracted JSON documents from case folder"""
+        self._cache.clear()
+        # One pool for every type beats reading each bucket lazily on first use
+        self._buckets = self._read_documents(DOCUMENT_TYPES)
+        self._loaded = True
+
+    @cached
+    def _police_parties(self) -> Dict[str, Dict[Any, Dict]]:
+        """Index the first police report's drivers and vehicles by vehicle number"""
+        if not self.police_reports:
+            return {"drivers": {}, "vehicles": {}}
+
+        report = self.police_reports[0]
+        # Later entries win, as when the lists were scanned for each lookup
+        return {
+            "drivers": {d.get("vehicle_number"): d for d in report.get("drivers", [])},
+            "vehicles": {v.get("vehicle_number"): v for v in report.get("vehicles", [])},
+        }
 
-        # Load medical records
-        med_records_path = self.case_folder / "MEDICAL_RECORDS"
-        if med_records_path.exists():
-            for file in med_records_path.glob("*.json"):
-                with open(file) as f:
-                    self.medical_records.append(json.load(f))
-
-        # Load police reports
-        police_path = self.case_folder / "POLICE_REPORT"
-        if police_path.exists():
-            for file in police_path.glob("*.json"):
-                with open(file) as f:
-                    self.police_reports.append(json.load(f))
-
-        # Load insurance policies
-        insurance_path = self.case_folder / "INSURANCE_POLICY"
-        if insurance_path.exists():
-            for file in insurance_path.glob("*.json"):
-                with open(file) as f:
-                    self.insurance_policies.append(json.load(f))
-
-        # Load medical bills
-        bills_path = self.case_folder / "MEDICAL_BILLS"
-        if bills_path.exists():
-            for file in bills_path.glob("*.json"):
-                with open(file) as f:
-                    self.medical_bills.append(json.load(f))
-
+    @cached
     def extract_plaintiff_info(self) -> Dict[str, Any]:
         """Extract plaintiff information from documents"""
         plaintiff = {
@@ -95,20 +306,20 @@ class PICaseAggregator:
 
         # Get from medical records
         if self.medical_records:
-            patient = self.medical_records[0].get("patient_info", {})
+            patient = self.medical_records[0].get("patient_info", EMPTY_SECTION)
             plaintiff["name"] = patient.get("name", "")
             plaintiff["date_of_birth"] = patient.get("date_of_birth", "")
             plaintiff["age_at_accident"] = patient.get("age_at_visit", 0)
 
         # Get address from police report
-        if self.police_reports:
-            for driver in self.police_reports[0].get("drivers", []):
-                if driver.get("vehicle_number") == 1:
-                    plaintiff["address"] = driver.get("address", "")
-                    plaintiff["phone"] = driver.get("phone", "")
+        driver = self._police_parties()["drivers"].get(1)
+        if driver is not None:
+            plaintiff["address"] = driver.get("address", "")
+            plaintiff["phone"] = driver.get("phone", "")
 
         return plaintiff
 
+    @cached
     def extract_defendant_info(self) -> Dict[str, Any]:
         """Extract defendant information from documents"""
         defendant = {
@@ -121,44 +332,44 @@ class PICaseAggregator:
             "insurance": {}
         }
 
-        if self.police_reports:
-            report = self.police_reports[0]
-
-            # Get defendant driver info
-            for driver in report.get("drivers", []):
-                if driver.get("vehicle_number") == 2:
-                    defendant["driver_name"] = driver.get("name", "")
-                    defendant["driver_address"] = driver.get("address", "")
-                    defendant["driver_phone"] = driver.get("phone", "")
-
-            # Get defendant vehicle info
-            for vehicle in report.get("vehicles", []):
-                if vehicle.get("vehicle_number") == 2:
-                    defendant["vehicle"] = {
-                        "year": vehicle.get("year", ""),
-                        "make": vehicle.get("make", ""),
-                        "model": vehicle.get("model", ""),
-                        "plate": vehicle.get("license_plate", "")
-                    }
-                    owner = vehicle.get("registered_owner", {})
-                    defendant["employer"] = owner.get("name", "")
-                    defendant["employer_address"] = owner.get("address", "")
+        parties = self._police_parties()
+
+        # Get defendant driver info
+        driver = parties["drivers"].get(2)
+        if driver is not None:
+            defendant["driver_name"] = driver.get("name", "")
+            defendant["driver_address"] = driver.get("address", "")
+            defendant["driver_phone"] = driver.get("phone", "")
+
+        # Get defendant vehicle info
+        vehicle = parties["vehicles"].get(2)
+        if vehicle is not None:
+            defendant["vehicle"] = {
+                "year": vehicle.get("year", ""),
+                "make": vehicle.get("make", ""),
+                "model": vehicle.get("model", ""),
+                "plate": vehicle.get("license_plate", "")
+            }
+            owner = vehicle.get("registered_owner", EMPTY_SECTION)
+            defendant["employer"] = owner.get("name", "")
+            defendant["employer_address"] = owner.get("address", "")
 
         # Get defendant insurance from policies
         for policy in self.insurance_policies:
-            if "Commercial" in policy.get("policy_info", {}).get("policy_type", ""):
+            if "Commercial" in policy.get("policy_info", EMPTY_SECTION).get("policy_type", ""):
                 defendant["insurance"] = {
                     "company": policy["policy_info"].get("insurance_company", ""),
                     "policy_number": policy["policy_info"].get("policy_number", ""),
-                    "claim_number": policy.get("claims_info", {}).get("claim_number", ""),
+                    "claim_number": policy.get("claims_info", EMPTY_SECTION).get("claim_number", ""),
                     "bi_limits": {
-                        "per_person": policy.get("coverages", {}).get("bodily_injury_liability", {}).get("per_person", 0),
-                        "per_accident": policy.get("coverages", {}).get("bodily_injury_liability", {}).get("per_accident", 0)
+                        "per_person": policy.get("coverages", EMPTY_SECTION).get("bodily_injury_liability", EMPTY_SECTION).get("per_person", 0),
+                        "per_accident": policy.get("coverages", EMPTY_SECTION).get("bodily_injury_liability", EMPTY_SECTION).get("per_accident", 0)
                     }
                 }
 
         return defendant
 
+    @cached
     def extract_accident_info(self) -> Dict[str, Any]:
         """Extract accident information from police report"""
         accident = {
@@ -175,8 +386,8 @@ class PICaseAggregator:
 
         if self.police_reports:
             report = self.police_reports[0]
-            accident_details = report.get("accident_details", {})
-            location = accident_details.get("location", {})
+            accident_details = report.get("accident_details", EMPTY_SECTION)
+            location = accident_details.get("location", EMPTY_SECTION)
 
             accident["date"] = accident_details.get("date", "")
             accident["time"] = accident_details.get("time", "")
@@ -185,26 +396,27 @@ class PICaseAggregator:
             accident["weather"] = accident_details.get("weather_conditions", "")
             accident["road_conditions"] = accident_details.get("road_conditions", "")
             accident["description"] = report.get("narrative", "")
-            accident["police_report_number"] = report.get("report_info", {}).get("report_number", "")
-            accident["precinct"] = report.get("report_info", {}).get("precinct", "")
+            accident["police_report_number"] = report.get("report_info", EMPTY_SECTION).get("report_number", "")
+            accident["precinct"] = report.get("report_info", EMPTY_SECTION).get("precinct", "")
 
         return accident
 
-    def extract_injuries(self) -> Dict[str, Any]:
-        """Consolidate all injuries from medical records"""
-        injuries = {
-            "primary_diagnoses": [],
-            "all_diagnoses": [],
-            "icd_codes": [],
-            "body_parts_affected": [],
-            "injury_summary": ""
-        }
-
+    @cached
+    def _scan_medical_records(self) -> Dict[str, Any]:
+        """Collect everything the analyses read from the medical records in one pass"""
         all_diagnoses = []
+        primary_diagnoses = []
         icd_codes = set()
         body_parts = set()
+        timeline = []
+        providers = []
+        seen_providers = set()
+        category_mask = 0
+        evidence = []
+        herniation_records = 0
 
         for record in self.medical_records:
+            # Diagnoses
             for diagnosis in record.get("diagnoses", []):
                 diag_entry = {
                     "description": diagnosis.get("description", ""),
@@ -220,11 +432,73 @@ class PICaseAggregator:
                     body_parts.add(diagnosis["body_part"])
 
                 if diagnosis.get("is_primary"):
-                    injuries["primary_diagnoses"].append(diag_entry)
+                    primary_diagnoses.append(diag_entry)
+
+            # Treatment timeline entry
+            doc_info = record.get("document_info", EMPTY_SECTION)
+            timeline.append({
+                "date": doc_info.get("date_of_service", ""),
+                "provider": doc_info.get("facility_name", ""),
+                "type": doc_info.get("record_type", ""),
+                "chief_complaint": record.get("chief_complaint", ""),
+                "treatments": [t.get("description", "") for t in record.get("treatment_provided", [])],
+                "referrals": [r.get("specialty", "") for r in record.get("referrals", [])]
+            })
+
+            # Treating facility
+            provider_name = doc_info.get("facility_name", "")
+            provider_key = _provider_key(provider_name)
+            if provider_key and provider_key not in seen_providers:
+                seen_providers.add(provider_key)
+                providers.append({
+                    "name": provider_name,
+                    "address": doc_info.get("facility_address", ""),
+                    "phone": doc_info.get("facility_phone", ""),
+                    "type": doc_info.get("record_type", ""),
+                    "treating_physician": record.get("provider_info", EMPTY_SECTION).get("name", "")
+                })
+
+            # NY serious injury indicators
+            indicators = record.get("ny_serious_injury_indicators", EMPTY_SECTION)
 
-        injuries["all_diagnoses"] = all_diagnoses
-        injuries["icd_codes"] = list(icd_codes)
-        injuries["body_parts_affected"] = list(body_parts)
+            for indicator, flag, _ in SERIOUS_INJURY_CATEGORIES:
+                if indicators.get(indicator):
+                    category_mask |= flag
+
+            for lang in indicators.get("supporting_language", []):
+                evidence.append(lang)
+
+            # Objective findings
+            if record.get("imaging_findings"):
+                for finding in record["imaging_findings"]:
+                    if "herniation" in finding.get("findings", "").lower():
+                        herniation_records += 1
+                        break
+
+        return {
+            "all_diagnoses": all_diagnoses,
+            "primary_diagnoses": primary_diagnoses,
+            "icd_codes": icd_codes,
+            "body_parts": body_parts,
+            "timeline": timeline,
+            "providers": providers,
+            "seen_providers": seen_providers,
+            "category_mask": category_mask,
+            "evidence": evidence,
+            "herniation_records": herniation_records,
+        }
+
+    @cached
+    def extract_injuries(self) -> Dict[str, Any]:
+        """Consolidate all injuries from medical records"""
+        scan = self._scan_medical_records()
+        injuries = {
+            "primary_diagnoses": scan["primary_diagnoses"],
+            "all_diagnoses": scan["all_diagnoses"],
+            "icd_codes": list(scan["icd_codes"]),
+            "body_parts_affected": list(scan["body_parts"]),
+            "injury_summary": ""
+        }
 
         # Generate injury summary
         if injuries["primary_diagnoses"]:
@@ -233,51 +507,25 @@ class PICaseAggregator:
 
         return injuries
 
+    @cached
     def build_treatment_timeline(self) -> List[Dict[str, Any]]:
         """Build chronological treatment timeline"""
-        timeline = []
-
-        # From medical records
-        for record in self.medical_records:
-            entry = {
-                "date": record.get("document_info", {}).get("date_of_service", ""),
-                "provider": record.get("document_info", {}).get("facility_name", ""),
-                "type": record.get("document_info", {}).get("record_type", ""),
-                "chief_complaint": record.get("chief_complaint", ""),
-                "treatments": [t.get("description", "") for t in record.get("treatment_provided", [])],
-                "referrals": [r.get("specialty", "") for r in record.get("referrals", [])]
-            }
-            timeline.append(entry)
-
         # Sort by date
-        timeline.sort(key=lambda x: x.get("date", ""))
-
-        return timeline
+        return sorted(self._scan_medical_records()["timeline"], key=lambda x: x.get("date", ""))
 
+    @cached
     def extract_medical_providers(self) -> List[Dict[str, Any]]:
         """Extract all medical provider information"""
-        providers = []
-        seen_providers = set()
-
-        for record in self.medical_records:
-            doc_info = record.get("document_info", {})
-            provider_name = doc_info.get("facility_name", "")
-
-            if provider_name and provider_name not in seen_providers:
-                seen_providers.add(provider_name)
-                providers.append({
-                    "name": provider_name,
-                    "address": doc_info.get("facility_address", ""),
-                    "phone": doc_info.get("facility_phone", ""),
-                    "type": doc_info.get("record_type", ""),
-                    "treating_physician": record.get("provider_info", {}).get("name", "")
-                })
+        scan = self._scan_medical_records()
+        providers = list(scan["providers"])
+        seen_providers = set(scan["seen_providers"])
 
         for bill in self.medical_bills:
-            provider_name = bill.get("billing_provider", {}).get("name", "")
-            if provider_name and provider_name not in seen_providers:
-                seen_providers.add(provider_name)
-                bp = bill.get("billing_provider", {})
+            bp = bill.get("billing_provider", EMPTY_SECTION)
+            provider_name = bp.get("name", "")
+            provider_key = _provider_key(provider_name)
+            if provider_key and provider_key not in seen_providers:
+                seen_providers.add(provider_key)
                 providers.append({
                     "name": provider_name,
                     "address": bp.get("address", ""),
@@ -288,6 +536,7 @@ class PICaseAggregator:
 
         return providers
 
+    @cached
     def calculate_special_damages(self) -> Dict[str, Any]:
         """Calculate total special damages from medical bills"""
         specials = {
@@ -300,13 +549,14 @@ class PICaseAggregator:
             "no_fault_exhausted": False,
             "no_fault_remaining": 50000,  # NY Basic PIP
             "breakdown_by_provider": [],
-            "breakdown_by_category": defaultdict(float)
+            "breakdown_by_category": {}
         }
+        breakdown_by_category = specials["breakdown_by_category"]
 
         for bill in self.medical_bills:
-            summary = bill.get("billing_summary", {})
-            lien = bill.get("lien_info", {})
-            treatment = bill.get("treatment_summary", {})
+            summary = bill.get("billing_summary", EMPTY_SECTION)
+            lien = bill.get("lien_info", EMPTY_SECTION)
+            treatment = bill.get("treatment_summary", EMPTY_SECTION)
 
             provider_total = summary.get("total_charges", 0)
             specials["total_medical_charges"] += provider_total
@@ -326,7 +576,7 @@ class PICaseAggregator:
 
             # Provider breakdown
             specials["breakdown_by_provider"].append({
-                "provider": bill.get("billing_provider", {}).get("name", ""),
+                "provider": bill.get("billing_provider", EMPTY_SECTION).get("name", ""),
                 "total_charges": provider_total,
                 "balance_due": summary.get("balance_due", 0),
                 "lien_amount": lien.get("lien_amount", 0) if lien.get("lien_filed") else 0
@@ -335,18 +585,20 @@ class PICaseAggregator:
             # Category breakdown
             for category, amount in treatment.items():
                 if amount and isinstance(amount, (int, float)) and amount > 0:
-                    clean_category = category.replace("_charges", "").replace("_", " ").title()
-                    specials["breakdown_by_category"][clean_category] += amount
+                    clean_category = CATEGORY_LABELS.get(category)
+                    if clean_category is None:
+                        clean_category = CATEGORY_LABELS[category] = (
+                            category.replace("_charges", "").replace("_", " ").title()
+                        )
+                    breakdown_by_category[clean_category] = breakdown_by_category.get(clean_category, 0.0) + amount
 
         # Calculate No-Fault remaining
         specials["no_fault_remaining"] = max(0, 50000 - specials["total_paid_by_no_fault"])
         specials["no_fault_exhausted"] = specials["no_fault_remaining"] == 0
 
-        # Convert defaultdict to regular dict
-        specials["breakdown_by_category"] = dict(specials["breakdown_by_category"])
-
         return specials
 
+    @cached
     def analyze_insurance_coverage(self) -> Dict[str, Any]:
         """Analyze available insurance coverage"""
         coverage = {
@@ -357,32 +609,32 @@ class PICaseAggregator:
         }
 
         for policy in self.insurance_policies:
-            policy_type = policy.get("policy_info", {}).get("policy_type", "")
-            insured = policy.get("named_insured", {}).get("name", "")
-            coverages = policy.get("coverages", {})
+            policy_type = policy.get("policy_info", EMPTY_SECTION).get("policy_type", "")
+            insured = policy.get("named_insured", EMPTY_SECTION).get("name", "")
+            coverages = policy.get("coverages", EMPTY_SECTION)
 
             if "Personal" in policy_type:
                 # Plaintiff's policy
                 coverage["plaintiff_coverage"] = {
                     "company": policy["policy_info"].get("insurance_company", ""),
                     "policy_number": policy["policy_info"].get("policy_number", ""),
-                    "no_fault_pip": coverages.get("personal_injury_protection_no_fault", {}).get("basic_pip", 0),
-                    "obel": coverages.get("personal_injury_protection_no_fault", {}).get("obel", 0),
-                    "sum_per_person": coverages.get("underinsured_motorist_sum", {}).get("per_person", 0),
-                    "sum_per_accident": coverages.get("underinsured_motorist_sum", {}).get("per_accident", 0)
+                    "no_fault_pip": coverages.get("personal_injury_protection_no_fault", EMPTY_SECTION).get("basic_pip", 0),
+                    "obel": coverages.get("personal_injury_protection_no_fault", EMPTY_SECTION).get("obel", 0),
+                    "sum_per_person": coverages.get("underinsured_motorist_sum", EMPTY_SECTION).get("per_person", 0),
+                    "sum_per_accident": coverages.get("underinsured_motorist_sum", EMPTY_SECTION).get("per_accident", 0)
                 }
             elif "Commercial" in policy_type:
                 # Defendant's policy
                 coverage["defendant_coverage"] = {
                     "company": policy["policy_info"].get("insurance_company", ""),
                     "policy_number": policy["policy_info"].get("policy_number", ""),
-                    "bi_per_person": coverages.get("bodily_injury_liability", {}).get("per_person", 0),
-                    "bi_per_accident": coverages.get("bodily_injury_liability", {}).get("per_accident", 0)
+                    "bi_per_person": coverages.get("bodily_injury_liability", EMPTY_SECTION).get("per_person", 0),
+                    "bi_per_accident": coverages.get("bodily_injury_liability", EMPTY_SECTION).get("per_accident", 0)
                 }
 
         # Calculate total available
-        def_bi = coverage.get("defendant_coverage", {}).get("bi_per_person", 0)
-        plt_sum = coverage.get("plaintiff_coverage", {}).get("sum_per_person", 0)
+        def_bi = coverage.get("defendant_coverage", EMPTY_SECTION).get("bi_per_person", 0)
+        plt_sum = coverage.get("plaintiff_coverage", EMPTY_SECTION).get("sum_per_person", 0)
 
         coverage["total_available_coverage"] = def_bi + plt_sum
 
@@ -395,6 +647,7 @@ class PICaseAggregator:
 
         return coverage
 
+    @cached
     def analyze_liability(self) -> Dict[str, Any]:
         """Analyze liability based on police report"""
         liability = {
@@ -408,7 +661,7 @@ class PICaseAggregator:
 
         if self.police_reports:
             report = self.police_reports[0]
-            fault = report.get("fault_indicators", {})
+            fault = report.get("fault_indicators", EMPTY_SECTION)
 
             liability["fault_determination"] = fault.get("fault_determination", "")
             liability["contributing_factors"] = fault.get("contributing_factors", [])
@@ -437,6 +690,7 @@ class PICaseAggregator:
 
         return liability
 
+    @cached
     def analyze_ny_serious_injury(self) -> Dict[str, Any]:
         """Analyze NY serious injury threshold under Insurance Law 5102(d)"""
         analysis = {
@@ -447,38 +701,20 @@ class PICaseAggregator:
             "risk_factors": []
         }
 
-        categories_found = set()
-        evidence = []
-
-        for record in self.medical_records:
-            indicators = record.get("ny_serious_injury_indicators", {})
-
-            if indicators.get("permanent_consequential_limitation"):
-                categories_found.add("Permanent Consequential Limitation")
-            if indicators.get("significant_limitation_of_use"):
-                categories_found.add("Significant Limitation of Use")
-            if indicators.get("permanent_loss_of_use"):
-                categories_found.add("Permanent Loss of Use")
-            if indicators.get("fracture"):
-                categories_found.add("Fracture")
-            if indicators.get("significant_disfigurement"):
-                categories_found.add("Significant Disfigurement")
-            if indicators.get("ninety_one_eighty_disability"):
-                categories_found.add("90/180 Day Disability")
+        scan = self._scan_medical_records()
+        category_mask = scan["category_mask"]
+        evidence = scan["evidence"]
 
-            for lang in indicators.get("supporting_language", []):
-                evidence.append(lang)
-
-        analysis["categories_met"] = list(categories_found)
+        analysis["categories_met"] = [name for _, flag, name in SERIOUS_INJURY_CATEGORIES if category_mask & flag]
         analysis["supporting_evidence"] = evidence
-        analysis["meets_threshold"] = len(categories_found) > 0
+        analysis["meets_threshold"] = category_mask != 0
 
         # Strength assessment
-        if "Permanent Consequential Limitation" in categories_found or "Permanent Loss of Use" in categories_found:
+        if category_mask & PERMANENT_CATEGORIES:
             analysis["strength_assessment"] = "Strong - Permanent limitation documented"
-        elif "Significant Limitation of Use" in categories_found:
+        elif category_mask & SIGNIFICANT_LIMITATION_OF_USE:
             analysis["strength_assessment"] = "Moderate-Strong - Significant limitation with objective findings"
-        elif "90/180 Day Disability" in categories_found:
+        elif category_mask & NINETY_ONE_EIGHTY_DISABILITY:
             analysis["strength_assessment"] = "Moderate - Must document 90 days disability in first 180 days"
         else:
             analysis["strength_assessment"] = "Weak - May not meet serious injury threshold"
@@ -486,6 +722,7 @@ class PICaseAggregator:
 
         return analysis
 
+    @cached
     def assess_case_value_factors(self) -> Dict[str, Any]:
         """Assess factors affecting case value"""
         factors = {
@@ -509,18 +746,16 @@ class PICaseAggregator:
             factors["positive_factors"].append("Multiple independent witnesses")
 
         serious_injury = self.analyze_ny_serious_injury()
-        if "Permanent" in str(serious_injury.get("categories_met", [])):
+        scan = self._scan_medical_records()
+        has_permanent = bool(scan["category_mask"] & PERMANENT_CATEGORIES)
+        if has_permanent:
             factors["positive_factors"].append("Permanent injury documented")
             factors["value_multipliers"].append("Permanent injury multiplier: 3-5x specials")
 
-        # Check for objective findings
-        for record in self.medical_records:
-            if record.get("imaging_findings"):
-                for finding in record["imaging_findings"]:
-                    if "herniation" in finding.get("findings", "").lower():
-                        factors["positive_factors"].append("MRI-confirmed disc herniation")
-                        factors["value_multipliers"].append("Disc herniation multiplier: 2-4x specials")
-                        break
+        # Check for objective findings, once per record with an MRI-confirmed herniation
+        herniation_records = scan["herniation_records"]
+        factors["positive_factors"].extend(["MRI-confirmed disc herniation"] * herniation_records)
+        factors["value_multipliers"].extend(["Disc herniation multiplier: 2-4x specials"] * herniation_records)
 
         # Negative factors
         if specials.get("no_fault_exhausted"):
@@ -530,7 +765,7 @@ class PICaseAggregator:
 
         # Estimate value range
         base = factors["special_damages_total"]
-        if "Permanent" in str(serious_injury.get("categories_met", [])):
+        if has_permanent:
             factors["estimated_value_range"] = {
                 "low": base * 2,
                 "mid": base * 3.5,
@@ -545,6 +780,20 @@ class PICaseAggregator:
 
         return factors
 
+    @cached
+    def _statute_of_limitations(self) -> Optional[datetime]:
+        """Three-year limitations date from the police report's accident date, if it parses"""
+        if not self.police_reports:
+            return None
+        accident_date_str = self.police_reports[0].get("accident_details", EMPTY_SECTION).get("date", "")
+        if not accident_date_str:
+            return None
+        try:
+            accident_date = datetime.strptime(accident_date_str, "%m/%d/%Y")
+        except ValueError:
+            return None
+        return accident_date + timedelta(days=365*3)
+
     def generate_recommended_actions(self) -> List[str]:
         """Generate recommended next actions for the case"""
         actions = []
@@ -555,24 +804,18 @@ class PICaseAggregator:
             actions.append("URGENT: No-Fault benefits nearly exhausted. Consider filing NF-10 denial appeal or transition to health insurance.")
 
         # Check statute of limitations
-        if self.police_reports:
-            accident_date_str = self.police_reports[0].get("accident_details", {}).get("date", "")
-            if accident_date_str:
-                try:
-                    accident_date = datetime.strptime(accident_date_str, "%m/%d/%Y")
-                    sol_date = accident_date + timedelta(days=365*3)
-                    days_remaining = (sol_date - datetime.now()).days
-                    if days_remaining < 180:
-                        actions.append(f"URGENT: Statute of limitations expires in {days_remaining} days ({sol_date.strftime('%m/%d/%Y')})")
-                    elif days_remaining < 365:
-                        actions.append(f"NOTE: Statute of limitations expires in {days_remaining} days ({sol_date.strftime('%m/%d/%Y')})")
-                except ValueError:
-                    pass
+        sol_date = self._statute_of_limitations()
+        if sol_date is not None:
+            days_remaining = (sol_date - datetime.now()).days
+            if days_remaining < 180:
+                actions.append(f"URGENT: Statute of limitations expires in {days_remaining} days ({sol_date.strftime('%m/%d/%Y')})")
+            elif days_remaining < 365:
+                actions.append(f"NOTE: Statute of limitations expires in {days_remaining} days ({sol_date.strftime('%m/%d/%Y')})")
 
         # Treatment recommendations
         serious_injury = self.analyze_ny_serious_injury()
-        if "90/180 Day Disability" in serious_injury.get("categories_met", []) and \
-           "Permanent" not in str(serious_injury.get("categories_met", [])):
+        category_mask = self._scan_medical_records()["category_mask"]
+        if category_mask & NINETY_ONE_EIGHTY_DISABILITY and not category_mask & PERMANENT_CATEGORIES:
             actions.append("Obtain narrative report documenting 90/180 day disability with specific activity limitations")
 
         if serious_injury.get("strength_assessment", "").startswith("Moderate"):
@@ -580,7 +823,7 @@ class PICaseAggregator:
 
         # Insurance actions
         coverage = self.analyze_insurance_coverage()
-        def_limits = coverage.get("defendant_coverage", {}).get("bi_per_person", 0)
+        def_limits = coverage.get("defendant_coverage", EMPTY_SECTION).get("bi_per_person", 0)
         if def_limits > 0:
             actions.append(f"Send policy limits demand to defendant's carrier (${def_limits:,} available)")
 
@@ -595,8 +838,19 @@ class PICaseAggregator:
         return actions
 
     def generate_summary(self) -> CaseSummary:
-        """Generate complete case summary"""
-        self.load_documents()
+        """Generate complete case summary
+
+        Documents are loaded on the first call only; later calls reuse the
+        cached analyses, which already run each other in dependency order.
+        The analyses return their cached results, shared between calls; the
+        summary holds deep copies, so editing it leaves them intact.
+        """
+        return copy.deepcopy(self._build_summary())
+
+    def _build_summary(self) -> CaseSummary:
+        """Case summary built on the shared cached analyses, for read-only use"""
+        if not self._loaded:
+            self.load_documents()
 
         case_id = self.case_folder.name
 
@@ -621,126 +875,101 @@ class PICaseAggregator:
 
     def generate_report(self, output_format: str = "json") -> str:
         """Generate formatted report"""
-        summary = self.generate_summary()
+        summary = self._build_summary()
 
         if output_format == "json":
-            return json.dumps(asdict(summary), indent=2, default=str)
+            return _dumps_json(summary)
         elif output_format == "markdown":
             return self._format_markdown(summary)
         elif output_format == "html":
             return self._format_html(summary)
         else:
-            return json.dumps(asdict(summary), indent=2, default=str)
+            return _dumps_json(summary)
+
+    def write_report(self, fp: TextIO, output_format: str = "json") -> None:
+        """Write formatted report to an open text file, without returning it as a string"""
+        summary = self._build_summary()
+
+        if output_format == "markdown":
+            fp.write(self._format_markdown(summary))
+        elif output_format == "html":
+            fp.write(self._format_html(summary))
+        else:
+            _dump_json(summary, fp)
 
     def _format_markdown(self, summary: CaseSummary) -> str:
         """Format summary as Markdown"""
-        md = []
-        md.append(f"# Case Summary: {summary.case_id}")
-        md.append(f"*Generated: {summary.generated_date}*\n")
-
-        md.append("## Plaintiff Information")
-        md.append(f"- **Name:** {summary.plaintiff['name']}")
-        md.append(f"- **DOB:** {summary.plaintiff['date_of_birth']}")
-        md.append(f"- **Age at Accident:** {summary.plaintiff['age_at_accident']}")
-        md.append(f"- **Address:** {summary.plaintiff['address']}\n")
-
-        md.append("## Defendant Information")
-        md.append(f"- **Driver:** {summary.defendant['driver_name']}")
-        md.append(f"- **Employer:** {summary.defendant['employer']}")
-        md.append(f"- **Vehicle:** {summary.defendant['vehicle'].get('year', '')} {summary.defendant['vehicle'].get('make', '')} {summary.defendant['vehicle'].get('model', '')}")
-        ins = summary.defendant.get('insurance', {})
-        md.append(f"- **Insurance:** {ins.get('company', '')} - Limits: ${ins.get('bi_limits', {}).get('per_person', 0):,}/{ins.get('bi_limits', {}).get('per_accident', 0):,}\n")
-
-        md.append("## Accident Details")
-        md.append(f"- **Date:** {summary.accident['date']} at {summary.accident['time']}")
-        md.append(f"- **Location:** {summary.accident['location']}, {summary.accident['borough']}")
-        md.append(f"- **Report #:** {summary.accident['police_report_number']}")
-        md.append(f"- **Description:** {summary.accident['description'][:500]}...\n")
-
-        md.append("## Injuries")
-        md.append("### Primary Diagnoses")
-        for diag in summary.injuries['primary_diagnoses']:
-            md.append(f"- {diag['description']} ({diag['icd_code']})")
-        md.append(f"\n**Body Parts Affected:** {', '.join(summary.injuries['body_parts_affected'])}\n")
-
-        md.append("## Special Damages")
+        plaintiff = summary.plaintiff
+        defendant = summary.defendant
+        accident = summary.accident
+        ins = defendant.get('insurance', EMPTY_SECTION)
+        bi_limits = ins.get('bi_limits', EMPTY_SECTION)
+        vehicle = defendant['vehicle']
         sd = summary.special_damages
-        md.append(f"| Category | Amount |")
-        md.append(f"|----------|--------|")
-        md.append(f"| Total Medical Charges | ${sd['total_medical_charges']:,.2f} |")
-        md.append(f"| Paid by No-Fault | ${sd['total_paid_by_no_fault']:,.2f} |")
-        md.append(f"| Adjustments | ${sd['total_adjustments']:,.2f} |")
-        md.append(f"| Outstanding Balance | ${sd['total_outstanding_balance']:,.2f} |")
-        md.append(f"| Total Liens | ${sd['total_liens']:,.2f} |")
-        md.append(f"| No-Fault Remaining | ${sd['no_fault_remaining']:,.2f} |")
-        md.append("")
-
-        md.append("## NY Serious Injury Analysis")
         si = summary.ny_serious_injury_analysis
-        md.append(f"**Meets Threshold:** {'Yes' if si['meets_threshold'] else 'No'}")
-        md.append(f"**Categories Met:** {', '.join(si['categories_met']) if si['categories_met'] else 'None'}")
-        md.append(f"**Strength:** {si['strength_assessment']}\n")
-
-        md.append("### Supporting Evidence")
-        for evidence in si['supporting_evidence'][:5]:
-            md.append(f"- {evidence}")
-        md.append("")
-
-        md.append("## Liability Analysis")
         la = summary.liability_analysis
-        md.append(f"**Fault Determination:** {la['fault_determination']}")
-        md.append(f"**Comparative Fault Risk:** {la['comparative_fault_risk']}")
-        md.append(f"**Assessment:** {la['liability_assessment']}\n")
-
-        md.append("## Case Value Assessment")
         cvf = summary.case_value_factors
-        md.append(f"**Special Damages:** ${cvf['special_damages_total']:,.2f}")
-        md.append(f"\n**Estimated Value Range:**")
         evr = cvf['estimated_value_range']
-        md.append(f"- Low: ${evr.get('low', 0):,.2f}")
-        md.append(f"- Mid: ${evr.get('mid', 0):,.2f}")
-        md.append(f"- High: ${evr.get('high', 0):,.2f}")
-        md.append(f"\n**Positive Factors:**")
-        for factor in cvf['positive_factors']:
-            md.append(f"- {factor}")
-        if cvf['negative_factors']:
-            md.append(f"\n**Negative Factors:**")
-            for factor in cvf['negative_factors']:
-                md.append(f"- {factor}")
-        md.append("")
-
-        md.append("## Recommended Actions")
-        for i, action in enumerate(summary.recommended_actions, 1):
-            md.append(f"{i}. {action}")
-
-        return "\n".join(md)
+        negative_factors = cvf['negative_factors']
+
+        fields = {
+            "case_id": summary.case_id,
+            "generated_date": summary.generated_date,
+            "plaintiff_name": plaintiff['name'],
+            "plaintiff_dob": plaintiff['date_of_birth'],
+            "plaintiff_age": plaintiff['age_at_accident'],
+            "plaintiff_address": plaintiff['address'],
+            "defendant_driver": defendant['driver_name'],
+            "defendant_employer": defendant['employer'],
+            "vehicle_year": vehicle.get('year', ''),
+            "vehicle_make": vehicle.get('make', ''),
+            "vehicle_model": vehicle.get('model', ''),
+            "insurance_company": ins.get('company', ''),
+            "bi_per_person": bi_limits.get('per_person', 0),
+            "bi_per_accident": bi_limits.get('per_accident', 0),
+            "accident_date": accident['date'],
+            "accident_time": accident['time'],
+            "accident_location": accident['location'],
+            "accident_borough": accident['borough'],
+            "police_report_number": accident['police_report_number'],
+            "accident_description": accident['description'][:500],
+            "primary_diagnoses": "".join([
+                f"\n- {diag['description']} ({diag['icd_code']})"
+                for diag in summary.injuries['primary_diagnoses']
+            ]),
+            "body_parts": ', '.join(summary.injuries['body_parts_affected']),
+            "total_medical_charges": sd['total_medical_charges'],
+            "total_paid_by_no_fault": sd['total_paid_by_no_fault'],
+            "total_adjustments": sd['total_adjustments'],
+            "total_outstanding_balance": sd['total_outstanding_balance'],
+            "total_liens": sd['total_liens'],
+            "no_fault_remaining": sd['no_fault_remaining'],
+            "meets_threshold": 'Yes' if si['meets_threshold'] else 'No',
+            "categories_met": ', '.join(si['categories_met']) or 'None',
+            "strength_assessment": si['strength_assessment'],
+            "supporting_evidence": "".join([f"\n- {evidence}" for evidence in si['supporting_evidence'][:5]]),
+            "fault_determination": la['fault_determination'],
+            "comparative_fault_risk": la['comparative_fault_risk'],
+            "liability_assessment": la['liability_assessment'],
+            "special_damages_total": cvf['special_damages_total'],
+            "value_low": evr.get('low', 0),
+            "value_mid": evr.get('mid', 0),
+            "value_high": evr.get('high', 0),
+            "positive_factors": "".join([f"\n- {factor}" for factor in cvf['positive_factors']]),
+            "negative_factors": (
+                "\n\n**Negative Factors:**" + "".join([f"\n- {factor}" for factor in negative_factors])
+                if negative_factors else ""
+            ),
+            "recommended_actions": "".join([
+                f"\n{i}. {action}" for i, action in enumerate(summary.recommended_actions, 1)
+            ]),
+        }
+        return MARKDOWN_REPORT_TEMPLATE.format_map(fields)
 
     def _format_html(self, summary: CaseSummary) -> str:
         """Format summary as HTML"""
         md_content = self._format_markdown(summary)
-
-        html = f"""<!DOCTYPE html>
-<html>
-<head>
-    <title>Case Summary - {summary.case_id}</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; max-width: 900px; margin: 0 auto; padding: 20px; }}
-        h1 {{ color: #2c3e50; border-bottom: 2px solid #3498db; }}
-        h2 {{ color: #34495e; margin-top: 30px; }}
-        table {{ border-collapse: collapse; width: 100%; margin: 15px 0; }}
-        th, td {{ border: 1px solid #ddd; padding: 10px; text-align: left; }}
-        th {{ background-color: #3498db; color: white; }}
-        .urgent {{ color: #e74c3c; font-weight: bold; }}
-        .positive {{ color: #27ae60; }}
-        .negative {{ color: #e74c3c; }}
-        pre {{ background: #f4f4f4; padding: 15px; overflow-x: auto; }}
-    </style>
-</head>
-<body>
-<pre>{md_content}</pre>
-</body>
-</html>"""
-        return html
+        return HTML_REPORT_TEMPLATE % (html.escape(summary.case_id, quote=False), html.escape(md_content, quote=False))
 
 
 def main():
@@ -757,14 +986,14 @@ def main():
         sys.exit(1)
 
     aggregator = PICaseAggregator(args.case_folder)
-    report = aggregator.generate_report(args.format)
 
     if args.output:
-        with open(args.output, 'w') as f:
-            f.write(report)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            aggregator.write_report(f, args.format)
         print(f"Report saved to: {args.output}")
     else:
-        print(report)
+        aggregator.write_report(sys.stdout, args.format)
+        sys.stdout.write("\n")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,20 @@
+"""
+Per-instance result cache shared by the case aggregators.
+"""
+
+import functools
+
+
+def cached(method):
+    """Cache a no-argument method's result in the instance's _cache dict
+
+    Every call returns the same cached object, so callers must not modify
+    it. Clearing _cache (as each aggregator does when documents are
+    reloaded) discards every cached result.
+    """
+    @functools.wraps(method)
+    def wrapper(self):
+        if method.__name__ not in self._cache:
+            self._cache[method.__name__] = method(self)
+        return self._cache[method.__name__]
+    return wrapper